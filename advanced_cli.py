@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+Advanced AI Text Humanizer - Command Line Interface
+Streams stdin to stdout, or processes files, directories and JSONL records
+
+Examples:
+    python advanced_cli.py --text "The implementation requires optimization." --verbose
+    cat draft.txt | python advanced_cli.py > humanized.txt
+    python advanced_cli.py "docs/**/*.md" --output-dir humanized/ --workers 8
+    python advanced_cli.py --jsonl records.jsonl --workers 8 --seed 42 > out.jsonl
+"""
+
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+from collections import deque
+
+from advanced_humanizer import AdvancedHumanizer, compile_lexicon
+from batch_humanizer import iter_humanize
+
+# File types picked up when a directory is given as input
+TEXT_EXTENSIONS = ('.txt', '.md')
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        description="🧠 Advanced AI Text Humanizer - transform AI-generated text into natural, human-like content"
+    )
+    parser.add_argument("inputs", nargs="*", help="Files, directories or glob patterns (default: read stdin)")
+    parser.add_argument("--text", help="Humanize this text instead of reading files or stdin")
+    parser.add_argument("--jsonl", action="store_true", help="Inputs are JSONL records; write JSONL records")
+    parser.add_argument("--id-field", default="id", help="JSONL field holding the record id (default: id)")
+    parser.add_argument("--text-field", default="text", help="JSONL field holding the text (default: text)")
+    parser.add_argument("--output-format", choices=["text", "jsonl"], help="Output format (default: jsonl with --jsonl, text otherwise)")
+    parser.add_argument("--output", "-o", help="Write output to this file instead of stdout")
+    parser.add_argument("--output-dir", help="Write one humanized file per input file into this directory, keeping relative paths")
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes (default: 1, 0 = all cores)")
+    parser.add_argument("--chunksize", type=int, default=8, help="Documents per worker task (default: 8)")
+    parser.add_argument("--seed", type=int, help="Seed every document for reproducible output (any worker count)")
+    parser.add_argument("--segmenter", choices=AdvancedHumanizer.SEGMENTERS, default="punkt", help="Sentence segmenter (default: punkt)")
+    parser.add_argument("--pack", dest="packs", action="append", default=[], help="Extra lexicon pack file or directory (.json/.tsv); repeatable")
+    parser.add_argument("--verbose", "-v", action="store_true", help="Show processing details")
+    parser.add_argument("--quiet", "-q", action="store_true", help="Do not print the throughput summary")
+    return parser
+
+
+def expand_inputs(patterns):
+    """Expand files, directories and glob patterns into a sorted list of paths"""
+    paths = []
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            for root, dirs, files in os.walk(pattern):
+                # Walk subdirectories in name order so output order is stable
+                dirs.sort()
+                paths.extend(
+                    os.path.join(root, name) for name in sorted(files)
+                    if name.endswith(TEXT_EXTENSIONS)
+                )
+        elif os.path.exists(pattern):
+            paths.append(pattern)
+        else:
+            matches = sorted(glob.glob(pattern, recursive=True))
+            if not matches:
+                raise FileNotFoundError(f"No files match {pattern!r}")
+            paths.extend(path for path in matches if os.path.isfile(path))
+    return paths
+
+
+def output_paths(paths, output_dir):
+    """Map input files to output files, keeping their paths relative to the inputs' common directory"""
+    if not paths:
+        return {}
+    root = os.path.commonpath([os.path.dirname(os.path.abspath(path)) for path in paths])
+    return {path: os.path.join(output_dir, os.path.relpath(os.path.abspath(path), root)) for path in paths}
+
+
+def unique_path(path, used):
+    """Number ``path`` as "name (2).ext", "name (3).ext", ... if it was already written"""
+    stem, extension = os.path.splitext(path)
+    count = 1
+    while path in used:
+        count += 1
+        path = f"{stem} ({count}){extension}"
+    used.add(path)
+    return path
+
+
+def read_jsonl(handle, source, args):
+    """Yield (id, text) pairs from a JSONL stream, or (id, error) for bad lines"""
+    for line_number, line in enumerate(handle, 1):
+        if not line.strip():
+            continue
+        fallback_id = f"{source}:{line_number}"
+        try:
+            record = json.loads(line)
+            record_id, text = record.get(args.id_field, fallback_id), record[args.text_field]
+        except (ValueError, KeyError, AttributeError) as e:
+            yield fallback_id, ValueError(f"Invalid record: {e}")
+            continue
+        if not isinstance(text, str):
+            yield record_id, ValueError(f"Invalid record: {args.text_field!r} must be a string, got {type(text).__name__}")
+        else:
+            yield record_id, text
+
+
+def read_records(args, paths):
+    """Yield (id, text) pairs for every input document"""
+    if args.text is not None:
+        yield "text", args.text
+    elif args.jsonl:
+        if not paths:
+            yield from read_jsonl(sys.stdin, "stdin", args)
+        for path in paths:
+            with open(path, encoding="utf-8") as handle:
+                yield from read_jsonl(handle, path, args)
+    else:
+        for path in paths:
+            with open(path, encoding="utf-8") as handle:
+                yield path, handle.read()
+
+
+class CountingReader:
+    """File wrapper counting the characters read through it"""
+
+    def __init__(self, handle):
+        self.handle = handle
+        self.chars = 0
+
+    def read(self, size=-1):
+        data = self.handle.read(size)
+        self.chars += len(data)
+        return data
+
+
+class Stats:
+    """Throughput counters for the final summary"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.documents = 0
+        self.errors = 0
+        self.chars_in = 0
+        self.chars_out = 0
+
+    def summary(self):
+        elapsed = max(time.perf_counter() - self.started, 1e-9)
+        return (
+            f"📈 {self.documents} documents ({self.errors} errors), "
+            f"{self.chars_in} → {self.chars_out} characters in {elapsed:.2f}s | "
+            f"{self.documents / elapsed:.1f} docs/s, {self.chars_in / elapsed / 1000:.1f} kchars/s"
+        )
+
+
+def humanize_records(records, args, options, stats):
+    """Humanize (id, text) pairs on the worker pool, yielding (id, result) in order"""
+    ids = deque()
+    failed = {}
+
+    def texts():
+        for index, (record_id, text) in enumerate(records):
+            ids.append(record_id)
+            if isinstance(text, Exception):
+                failed[index] = text
+                text = ""
+            else:
+                stats.chars_in += len(text)
+            yield text
+
+    results = iter_humanize(
+        texts(), workers=args.workers or os.cpu_count(), chunksize=args.chunksize,
+        return_exceptions=True, seed=args.seed, options=options
+    )
+    for index, result in enumerate(results):
+        yield ids.popleft(), failed.pop(index, result)
+
+
+def write_result(out, record_id, result, args, output_format, stats, target=None):
+    """Write one humanized document in the requested format, or to ``target`` with --output-dir"""
+    stats.documents += 1
+    if isinstance(result, Exception):
+        stats.errors += 1
+        print(f"❌ {record_id}: {result}", file=sys.stderr)
+        if output_format == "jsonl":
+            out.write(json.dumps({args.id_field: record_id, "error": str(result)}, ensure_ascii=False) + "\n")
+        return
+
+    stats.chars_out += len(result)
+    if target is not None:
+        os.makedirs(os.path.dirname(target) or ".", exist_ok=True)
+        with open(target, "w", encoding="utf-8") as handle:
+            handle.write(result)
+    elif output_format == "jsonl":
+        out.write(json.dumps({args.id_field: record_id, args.text_field: result}, ensure_ascii=False) + "\n")
+    else:
+        out.write(result + "\n")
+
+    if args.verbose:
+        print(f"✅ {record_id}: {len(result)} characters", file=sys.stderr)
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    output_format = args.output_format or ("jsonl" if args.jsonl else "text")
+
+    options = {"segmenter": args.segmenter, "packs": tuple(args.packs)}
+
+    try:
+        paths = expand_inputs(args.inputs)
+        compile_lexicon(args.packs)
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 2
+
+    if args.verbose:
+        print("🧠 Advanced AI Text Humanizer", file=sys.stderr)
+        print("=" * 50, file=sys.stderr)
+        print(f"Inputs: {len(paths) or ('text' if args.text is not None else 'stdin')} | Workers: {args.workers or os.cpu_count()}", file=sys.stderr)
+
+    stats = Stats()
+    out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    try:
+        if not paths and args.text is None and not args.jsonl and output_format == "text":
+            # Plain text on stdin: stream it paragraph by paragraph
+            humanizer = AdvancedHumanizer(**options)
+            reader = CountingReader(sys.stdin)
+            for piece in humanizer.humanize_stream(reader, seed=args.seed):
+                stats.chars_out += len(piece)
+                out.write(piece)
+            stats.documents = 1
+            stats.chars_in = reader.chars
+        else:
+            if not paths and args.text is None and not args.jsonl:
+                records = iter([("stdin", sys.stdin.read())])
+            else:
+                records = read_records(args, paths)
+            targets = output_paths(paths, args.output_dir) if args.output_dir and not args.jsonl else {}
+            used = set()
+            for record_id, result in humanize_records(records, args, options, stats):
+                target = None
+                if args.output_dir:
+                    # Files keep their relative paths; other ids that collide are numbered
+                    default = os.path.join(args.output_dir, os.path.basename(str(record_id)))
+                    target = unique_path(targets.get(record_id, default), used)
+                write_result(out, record_id, result, args, output_format, stats, target)
+        out.flush()
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    if not args.quiet:
+        print(stats.summary(), file=sys.stderr)
+    return 1 if stats.errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
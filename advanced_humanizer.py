@@ -4,284 +4,829 @@ Advanced Text Humanizer - Aggressive AI Detection Bypass
 Reduces AI detection scores to under 10%
 """
 
+import functools
+import hashlib
+import inspect
+import io
+import os
 import re
 import random
-import nltk
-from collections import defaultdict
+import sys
+import threading
+import time
+from collections import OrderedDict, defaultdict, namedtuple
 import string
 
-# Global NLTK data download function
-def ensure_nltk_data():
-    """Ensure all required NLTK data is downloaded"""
-    required_downloads = [
-        ('tokenizers/punkt', 'punkt'),
-        ('tokenizers/punkt_tab', 'punkt_tab'),  # New punkt tokenizer
-        ('corpora/wordnet', 'wordnet'),
-        ('corpora/omw-1.4', 'omw-1.4')
-    ]
-    
-    for data_path, download_name in required_downloads:
+from lexicon_artifact import ArtifactMapping, load_tables, source_hash
+from lexicon_packs import load_pack_tables
+from sentence_segmenter import SENTENCE_END_PATTERN, segment_sentences
+
+# NLTK data directory shipped next to this module, if any
+BUNDLED_NLTK_DATA = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'nltk_data')
+
+_nltk_ready = None
+_nltk_lock = threading.Lock()
+
+# Process-wide humanizers built by get_shared_humanizer, keyed by options
+_shared_humanizers = {}
+_shared_lock = threading.Lock()
+
+# Compiled lexicons built by compile_lexicon, keyed by table content hash
+_compiled_lexicons = OrderedDict()
+_lexicon_lock = threading.Lock()
+_MAX_COMPILED_LEXICONS = 8
+
+
+class NLTKDataError(LookupError):
+    """Raised when NLTK sentence tokenizer data is missing in offline mode"""
+
+
+def _env_flag(name):
+    return os.environ.get(name, '').strip().lower() in ('1', 'true', 'yes', 'on')
+
+
+def _punkt_available(nltk):
+    """Check that sent_tokenize can load its model (this also warms it up)"""
+    try:
+        nltk.sent_tokenize("Ready. Set.")
+        return True
+    except LookupError:
+        return False
+
+
+def _resolve_nltk_data(offline, data_dir):
+    """Import NLTK and locate (or download) the punkt tokenizer data"""
+    try:
+        import nltk
+    except ImportError:
+        print("NLTK is not installed, using the built-in sentence segmenter", file=sys.stderr)
+        return False
+
+    for path in (BUNDLED_NLTK_DATA, data_dir or os.environ.get('HUMANIZER_NLTK_DATA')):
+        if path and os.path.isdir(path) and path not in nltk.data.path:
+            nltk.data.path.insert(0, path)
+
+    if _punkt_available(nltk):
+        return True
+    if offline:
+        return False
+
+    # punkt_tab is used by current NLTK releases, punkt by older ones
+    for download_name in ('punkt_tab', 'punkt'):
+        print(f"Downloading {download_name}...", file=sys.stderr)
         try:
-            nltk.data.find(data_path)
-        except LookupError:
+            nltk.download(download_name, quiet=True)
+        except Exception as e:
+            print(f"Failed to download {download_name}: {e}", file=sys.stderr)
+
+    if _punkt_available(nltk):
+        return True
+    print("NLTK punkt data unavailable, using the built-in sentence segmenter", file=sys.stderr)
+    return False
+
+
+def ensure_nltk_data(offline=None, data_dir=None):
+    """Resolve the NLTK sentence tokenizer data once per process
+
+    NLTK is imported lazily and searched for punkt in ``data_dir`` (or
+    $HUMANIZER_NLTK_DATA), the bundled ``nltk_data`` directory and NLTK's own
+    paths. Missing data is downloaded once unless ``offline`` (or
+    $HUMANIZER_OFFLINE) is set, in which case NLTKDataError is raised.
+    Returns whether punkt can be used.
+    """
+    global _nltk_ready
+    if offline is None:
+        offline = _env_flag('HUMANIZER_OFFLINE')
+
+    with _nltk_lock:
+        if _nltk_ready is None:
+            _nltk_ready = _resolve_nltk_data(offline, data_dir)
+
+    if not _nltk_ready and offline:
+        raise NLTKDataError(
+            "NLTK punkt data not found and offline mode is on. Install it with "
+            f"'python -m nltk.downloader -d {BUNDLED_NLTK_DATA} punkt_tab', "
+            "point HUMANIZER_NLTK_DATA at an existing nltk_data directory, "
+            "or use AdvancedHumanizer(segmenter='builtin')."
+        )
+    return _nltk_ready
+
+_WORD_RE = re.compile(r'\w+')
+
+class PhraseMatcher:
+    """Case-insensitive whole-word matcher that rewrites a phrase table in one scan
+
+    Tables made only of single words are matched with a generic word scanner
+    and a dict lookup, so the cost does not grow with the table size. Tables
+    with multi-word phrases are compiled into one longest-first alternation.
+    An ArtifactMapping is used as it is, looking words up in the mmap'd index.
+    """
+
+    def __init__(self, table):
+        if isinstance(table, ArtifactMapping):
+            self.table = table
+            single_words = table.single_words
+        else:
+            self.table = {}
+            for phrase, replacement in table.items():
+                self.table.setdefault(phrase.lower(), replacement)
+            single_words = all(_WORD_RE.fullmatch(phrase) for phrase in self.table)
+
+        if single_words:
+            self.regex = _WORD_RE
+        else:
+            phrases = sorted({phrase.lower() for phrase in self.table}, key=len, reverse=True)
+            alternation = '|'.join(re.escape(phrase) for phrase in phrases)
+            self.regex = re.compile(r'\b(?:' + alternation + r')\b', re.IGNORECASE)
+
+    def sub(self, text):
+        """Replace every table hit in the text"""
+        lookup = self.table.get
+
+        def replace(match):
+            found = match.group()
+            return lookup(found.lower(), found)
+
+        return self.regex.sub(replace, text)
+
+
+# Word-bounded literal phrase such as r'\bin order to\b', whose boundaries can be shared
+_BOUNDED_PHRASE_RE = re.compile(r"\\b([\w' -]+)\\b")
+
+
+class RuleMatcher:
+    """Set of (regex, replacement) rules fused into one case-insensitive scan
+
+    Each rule becomes a named alternative, so a single pass finds every hit
+    and the callback knows which rule matched. Word-bounded phrase rules
+    share one pair of ``\\b`` around their alternation, so the scan only
+    tries them at word starts. ``suffix`` is appended to every rule.
+    Passing ``active`` restricts the replacement to a subset of the rules
+    for that call. Replacements are literal text; patterns that do not fuse
+    raise ValueError.
+    """
+
+    def __init__(self, rules, suffix=''):
+        self.replacements = [replacement for _, replacement in rules]
+        phrases = []
+        others = []
+        for index, (pattern, _) in enumerate(rules):
+            # A pattern that is valid and group-free on its own cannot leak
+            # out of its alternative, so every match names the rule it hit
             try:
-                print(f"Downloading {download_name}...")
-                nltk.download(download_name, quiet=True)
-            except Exception as e:
-                print(f"Failed to download {download_name}: {e}")
-                # Try alternative if punkt_tab fails
-                if download_name == 'punkt_tab':
-                    try:
-                        nltk.download('punkt', quiet=True)
-                    except:
-                        pass
-
-# Ensure NLTK data is available
-ensure_nltk_data()
+                groups = re.compile(pattern).groups
+            except re.error as e:
+                raise ValueError(f"Invalid rule pattern {pattern!r}: {e}") from None
+            if groups:
+                raise ValueError(f"Rule pattern {pattern!r} has capture groups, use (?:...) instead")
+            match = _BOUNDED_PHRASE_RE.fullmatch(pattern)
+            if match:
+                phrases.append(f'(?P<r{index}>{match.group(1)})')
+            else:
+                others.append(f'(?P<r{index}>{pattern}){suffix}')
+        if phrases:
+            others.insert(0, r'\b(?:' + '|'.join(phrases) + r')\b' + suffix)
+        try:
+            self.regex = re.compile('|'.join(others), re.IGNORECASE)
+        except re.error as e:
+            raise ValueError(f"Rule patterns cannot be combined: {e}") from None
 
-class AdvancedHumanizer:
-    def __init__(self):
-        # Ensure NLTK data is available when class is initialized
-        ensure_nltk_data()
-            
-        # Aggressive word replacements - AI to Human
-        self.aggressive_replacements = {
-            # Formal academic words → Casual equivalents
-            "utilize": "use", "utilization": "use", "utilized": "used",
-            "implement": "do", "implementation": "doing", "implemented": "did",
-            "facilitate": "help", "facilitating": "helping", "facilitated": "helped",
-            "demonstrate": "show", "demonstrates": "shows", "demonstrated": "showed",
-            "indicate": "show", "indicates": "shows", "indicated": "showed",
-            "significant": "big", "significantly": "really", 
-            "substantial": "large", "substantially": "really",
-            "numerous": "many", "various": "different", "multiple": "many",
-            "however": "but", "nevertheless": "but", "furthermore": "also",
-            "therefore": "so", "consequently": "so", "subsequently": "then",
-            "moreover": "also", "additionally": "also", "alternatively": "or",
-            "approximately": "about", "approximately": "around",
-            "methodology": "method", "methodologies": "methods",
-            "optimization": "improvement", "optimizations": "improvements",
-            "enhancement": "improvement", "enhancements": "improvements",
-            "acquisition": "getting", "acquire": "get", "acquired": "got",
-            "comprehension": "understanding", "comprehend": "understand",
-            "determination": "finding out", "determine": "find out",
-            "examination": "looking at", "examine": "look at",
-            "investigation": "checking", "investigate": "check",
-            "establishment": "setting up", "establish": "set up",
-            "consideration": "thinking about", "consider": "think about",
-            "evaluation": "checking", "evaluate": "check",
-            "analysis": "breakdown", "analyze": "break down",
-            "synthesis": "putting together", "synthesize": "put together",
-            "verification": "checking", "verify": "check",
-            "modification": "change", "modify": "change", "modified": "changed",
-            "generation": "making", "generate": "make", "generated": "made",
-            "creation": "making", "create": "make", "created": "made",
-            "construction": "building", "construct": "build", "constructed": "built",
-            "development": "building", "develop": "build", "developed": "built",
-            "production": "making", "produce": "make", "produced": "made",
-            "administration": "running", "administer": "run", "administered": "ran",
-            "coordination": "organizing", "coordinate": "organize", "coordinated": "organized",
-            "collaboration": "working together", "collaborate": "work together",
-            "communication": "talking", "communicate": "talk", "communicated": "talked",
-            "documentation": "writing down", "document": "write down", "documented": "wrote down",
-            "specification": "details", "specify": "detail", "specified": "detailed",
-            "requirement": "need", "requirements": "needs", "required": "needed",
-            "recommendation": "suggestion", "recommend": "suggest", "recommended": "suggested",
-            "conclusion": "ending", "conclude": "end", "concluded": "ended",
-            "decision": "choice", "decide": "choose", "decided": "chose",
-            "selection": "picking", "select": "pick", "selected": "picked",
-            "identification": "finding", "identify": "find", "identified": "found",
-            "recognition": "spotting", "recognize": "spot", "recognized": "spotted",
-            "observation": "seeing", "observe": "see", "observed": "saw",
-            "notification": "telling", "notify": "tell", "notified": "told",
-            "information": "info", "informational": "info-based",
-            "operational": "working", "operations": "work", "operate": "work",
-            "functional": "working", "function": "work", "functions": "works",
-            "professional": "work-related", "professionalism": "being professional",
-            "traditional": "old", "traditionally": "usually",
-            "conventional": "normal", "conventionally": "normally",
-            "fundamental": "basic", "fundamentally": "basically",
-            "essential": "key", "essentially": "basically",
-            "critical": "important", "critically": "importantly",
-            "optimal": "best", "optimally": "best way",
-            "maximum": "most", "maximize": "boost", "maximized": "boosted",
-            "minimum": "least", "minimize": "reduce", "minimized": "reduced",
-            "superior": "better", "superiority": "being better",
-            "inferior": "worse", "inferiority": "being worse",
-            "advanced": "newer", "advancement": "improvement",
-            "sophisticated": "complex", "sophistication": "complexity",
-            "comprehensive": "complete", "comprehensively": "completely",
-            "extensive": "wide", "extensively": "widely",
-            "intensive": "heavy", "intensively": "heavily",
-            "effective": "good", "effectiveness": "how good",
-            "efficient": "fast", "efficiency": "speed",
-            "accurate": "right", "accuracy": "being right",
-            "precise": "exact", "precision": "being exact",
-            "reliable": "dependable", "reliability": "dependability",
-            "consistent": "steady", "consistency": "steadiness",
-            "persistent": "lasting", "persistence": "lasting",
-            "continuous": "ongoing", "continuously": "ongoing",
-            "simultaneous": "at the same time", "simultaneously": "at the same time",
-            "immediate": "instant", "immediately": "right away",
-            "subsequent": "next", "subsequently": "then",
-            "previous": "earlier", "previously": "before",
-            "initial": "first", "initially": "at first",
-            "final": "last", "finally": "in the end",
-            "ultimate": "final", "ultimately": "in the end",
-            "primary": "main", "primarily": "mainly",
-            "secondary": "second", "secondarily": "secondly",
-            "tertiary": "third",
-            "alternative": "other", "alternatively": "or",
-            "additional": "extra", "additionally": "also",
-            "supplementary": "extra", "supplement": "add to",
-            "complementary": "matching", "complement": "match",
-            "proportional": "matching", "proportion": "part",
-            "equivalent": "equal", "equivalence": "equality",
-            "identical": "same", "identity": "sameness",
-            "similar": "alike", "similarity": "likeness",
-            "different": "unlike", "difference": "gap",
-            "distinct": "separate", "distinction": "separation",
-            "unique": "one-of-a-kind", "uniqueness": "being one-of-a-kind",
-            "specific": "exact", "specifically": "exactly",
-            "general": "broad", "generally": "broadly",
-            "particular": "specific", "particularly": "especially",
-            "individual": "single", "individually": "one by one",
-            "collective": "group", "collectively": "as a group",
-            "universal": "worldwide", "universally": "worldwide",
-            "global": "worldwide", "globally": "worldwide",
-            "local": "nearby", "locally": "nearby",
-            "regional": "area-based", "regionally": "by area",
-            "national": "country-wide", "nationally": "country-wide",
-            "international": "between countries", "internationally": "between countries"
+    def apply(self, text, active=None):
+        """Return (text with the ``active`` rules applied, whether any rule matched)"""
+        replacements = self.replacements
+        matched = False
+
+        def replace(match):
+            nonlocal matched
+            matched = True
+            index = int(match.lastgroup[1:])
+            if active is None or index in active:
+                return replacements[index]
+            return match.group()
+
+        return self.regex.sub(replace, text), matched
+
+    def sub(self, text, active=None):
+        """Apply the rules (or only the ``active`` rule indexes) to the text"""
+        if active is not None and not active:
+            return text
+        return self.apply(text, active)[0]
+
+
+_TERMINAL_RE = re.compile(SENTENCE_END_PATTERN + '$')
+
+# Words of a multi-line sentence, each keeping the line break that follows it
+_LINE_WORD_RE = re.compile(r'\S+(?:[ \t]*\r?\n[ \t]*)?')
+
+# Pipeline stages reported to progress callbacks, in order
+PIPELINE_STAGES = (
+    'tokenize', 'lexicon', 'sentences', 'contractions',
+    'casual', 'structure', 'imperfections'
+)
+
+# Progress updates sent per stage while rewriting long documents
+_PROGRESS_STEPS = 20
+
+# Paragraph separators and sentence ends used to cut streamed input
+_PARAGRAPH_BREAK_RE = re.compile(r'\r?\n(?:[ \t]*\r?\n)+')
+_PARAGRAPH_SPLIT_RE = re.compile(r'(\r?\n(?:[ \t]*\r?\n)+)')
+_SENTENCE_END_RE = re.compile(SENTENCE_END_PATTERN + r'\s+')
+
+# Input size (characters) from which paragraphs go to a process pool
+PARALLEL_THRESHOLD = 100_000
+
+# Deterministic rewrites tracked per sentence once they reach a fixed point
+_FIXED_LEXICON = 1
+_FIXED_TRANSITIONS = 2
+_FIXED_CONTRACTIONS = 4
+# No imperfection rule matches at all, so no subset of the rules can apply
+_FIXED_IMPERFECTIONS = 8
+
+# Chance of each random rewrite at the default settings (intensity 7)
+_BASE_PROBABILITIES = {
+    'starter': 0.3, 'filler': 0.2, 'connector': 0.4,
+    'ellipsis': 0.1, 'exclamation': 0.05, 'casual_addition': 0.15,
+    'restructure': 0.2, 'imperfection': 0.3,
+}
+
+_DEFAULT_INTENSITY = 7
+
+# Multipliers applied by each setting ('*' scales every probability);
+# 'contractions' switches that stage off
+_MODE_PROFILES = {
+    'standard': {'*': 0.7},
+    'advanced': {},
+    'professional': {'filler': 0, 'casual_addition': 0, 'exclamation': 0, 'imperfection': 0},
+    'creative': {'starter': 1.3, 'ellipsis': 1.5, 'casual_addition': 1.5},
+}
+_LANGUAGE_PROFILES = {
+    'casual': {},
+    'professional': {'filler': 0, 'casual_addition': 0.5, 'exclamation': 0},
+    'academic': {'contractions': False, 'filler': 0, 'ellipsis': 0, 'exclamation': 0,
+                 'casual_addition': 0, 'imperfection': 0},
+    'creative': {'starter': 1.3, 'ellipsis': 1.5},
+    'conversational': {'filler': 1.5, 'connector': 1.2, 'casual_addition': 1.5},
+}
+_TONE_PROFILES = {
+    'friendly': {},
+    'formal': {'filler': 0, 'ellipsis': 0, 'exclamation': 0, 'casual_addition': 0, 'imperfection': 0},
+    'witty': {'ellipsis': 1.5, 'casual_addition': 1.5},
+    'serious': {'ellipsis': 0.5, 'exclamation': 0, 'casual_addition': 0.5},
+    'enthusiastic': {'exclamation': 3},
+}
+
+# Setting names accepted by compile_plan, in the order the UI lists them
+MODES = tuple(key.title() for key in _MODE_PROFILES)
+LANGUAGE_STYLES = tuple(key.title() for key in _LANGUAGE_PROFILES)
+TONES = tuple(key.title() for key in _TONE_PROFILES)
+
+ExecutionPlan = namedtuple('ExecutionPlan', ['stages', 'contractions'] + list(_BASE_PROBABILITIES))
+ExecutionPlan.__doc__ = """Stages to run and the chance of each random rewrite for one settings combination"""
+
+
+def _profile(profiles, name, setting):
+    if name is None:
+        return {}
+    try:
+        return profiles[name.lower()]
+    except KeyError:
+        raise ValueError(
+            f"Unknown {setting} {name!r}, expected one of {tuple(key.title() for key in profiles)}"
+        ) from None
+
+
+@functools.lru_cache(maxsize=256)
+def compile_plan(mode=None, intensity=None, language=None, tone=None):
+    """Compile user settings into an ExecutionPlan (cached per combination)
+
+    ``intensity`` (1-10, default 7) scales every probability; at 3 or less
+    fillers, casual elements and restructuring are skipped, and at 1 only
+    the word-level stages run. Mode, language style and tone adjust
+    individual rewrites. Stages whose probabilities all end up at zero are
+    left out of ``stages`` so they cost nothing. The defaults, and the app's
+    defaults (Advanced, 7, Casual, Friendly), give the full pipeline.
+    """
+    if intensity is None:
+        intensity = _DEFAULT_INTENSITY
+    if isinstance(intensity, bool) or not isinstance(intensity, int) or not 1 <= intensity <= 10:
+        raise ValueError(f"intensity must be an integer from 1 to 10, got {intensity!r}")
+
+    probabilities = dict(_BASE_PROBABILITIES)
+    contractions = True
+    for profile in (
+        _profile(_MODE_PROFILES, mode, 'mode'),
+        _profile(_LANGUAGE_PROFILES, language, 'language'),
+        _profile(_TONE_PROFILES, tone, 'tone'),
+    ):
+        for knob, factor in profile.items():
+            if knob == 'contractions':
+                contractions = factor
+            elif knob == '*':
+                probabilities = {name: p * factor for name, p in probabilities.items()}
+            else:
+                probabilities[knob] *= factor
+
+    if intensity != _DEFAULT_INTENSITY:
+        probabilities = {name: p * intensity / _DEFAULT_INTENSITY for name, p in probabilities.items()}
+    if intensity <= 3:
+        for knob in ('filler', 'ellipsis', 'exclamation', 'casual_addition', 'restructure'):
+            probabilities[knob] = 0
+    if intensity == 1:
+        for knob in ('starter', 'connector', 'imperfection'):
+            probabilities[knob] = 0
+    probabilities = {name: min(p, 1.0) for name, p in probabilities.items()}
+
+    # Removing AI transitions is deterministic, so the sentence loop always runs
+    stages = {'tokenize', 'lexicon', 'sentences'}
+    if contractions:
+        stages.add('contractions')
+    if probabilities['ellipsis'] or probabilities['exclamation'] or probabilities['casual_addition']:
+        stages.add('casual')
+    if probabilities['restructure']:
+        stages.add('structure')
+    if probabilities['imperfection']:
+        stages.add('imperfections')
+    return ExecutionPlan(stages=frozenset(stages), contractions=contractions, **probabilities)
+
+
+class StageStats:
+    """Cumulative wall time, call count and input size per pipeline stage
+
+    Recording is off unless ``enabled`` is set (or HUMANIZER_PROFILE=1), so
+    an uninstrumented call only pays for one attribute check. Counters add
+    up across calls and threads until ``reset`` is called.
+    """
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._stages = {}
+
+    def record(self, stage, started, chars):
+        """Add the time since ``started`` to ``stage`` and return the current time"""
+        now = time.perf_counter()
+        with self._lock:
+            totals = self._stages.get(stage)
+            if totals is None:
+                totals = self._stages[stage] = [0, 0.0, 0]
+            totals[0] += 1
+            totals[1] += now - started
+            totals[2] += chars
+        return now
+
+    def snapshot(self):
+        """Return {stage: {calls, seconds, chars, mean_ms, chars_per_s}} in pipeline order"""
+        with self._lock:
+            stages = {stage: list(totals) for stage, totals in self._stages.items()}
+        order = {stage: index for index, stage in enumerate(PIPELINE_STAGES)}
+        return {
+            stage: {
+                'calls': calls,
+                'seconds': seconds,
+                'chars': chars,
+                'mean_ms': seconds / calls * 1000,
+                'chars_per_s': chars / seconds if seconds else 0.0,
+            }
+            for stage, (calls, seconds, chars) in sorted(
+                stages.items(), key=lambda item: order.get(item[0], len(order))
+            )
         }
-        
-        # Sentence starters that sound human
-        self.human_starters = [
-            "Well, ", "Actually, ", "You know, ", "Honestly, ", "Look, ",
-            "Listen, ", "So, ", "Anyway, ", "I mean, ", "To be fair, ",
-            "Let's be real, ", "Here's the thing - ", "The way I see it, ",
-            "From what I can tell, ", "As far as I know, ", "It seems like ",
-            "Basically, ", "Pretty much, ", "More or less, ", "Kind of ",
-            "Sort of ", "I guess ", "Maybe ", "Probably ", "Likely ",
-            "It's like ", "Think about it - ", "Consider this: ",
-            "Get this - ", "Check it out - ", "Here's what happens: "
-        ]
-        
-        # Conversational connectors
-        self.connectors = [
-            "and then", "so then", "after that", "next thing", "plus",
-            "on top of that", "what's more", "not to mention", "besides",
-            "by the way", "speaking of which", "while we're at it",
-            "come to think of it", "now that I think about it"
-        ]
-        
-        # Filler words and expressions
-        self.fillers = [
-            "you know", "like", "I mean", "sort of", "kind of", "pretty much",
-            "more or less", "or something", "or whatever", "and stuff",
-            "and things like that", "and all that", "you get the idea",
-            "if you know what I mean", "right?", "you see"
+
+    def reset(self):
+        """Drop every recorded measurement"""
+        with self._lock:
+            self._stages.clear()
+
+
+class Sentence:
+    """One sentence of a Document, held as text or as word tokens on demand
+
+    Phrase stages read and write ``text`` while word stages use ``words``;
+    the other form is only rebuilt when it is next read. A word followed by
+    a line break keeps it, so wrapped lines and list items survive. Terminal punctuation
+    is kept apart from the body and ``separator`` is the whitespace rendered
+    before the sentence. ``fixed`` flags the deterministic rewrites that leave the
+    current text unchanged; any edit of the text clears them.
+    """
+
+    __slots__ = ('_text', '_words', 'terminal', 'separator', 'fixed')
+
+    def __init__(self, text, terminal='', separator=' '):
+        self._text = text
+        self._words = None
+        self.terminal = terminal
+        self.separator = separator
+        self.fixed = 0
+
+    @classmethod
+    def parse(cls, raw, separator=' '):
+        """Build a sentence from segmenter output, splitting off its terminal"""
+        raw = raw.strip()
+        match = _TERMINAL_RE.search(raw)
+        if match:
+            return cls(raw[:match.start()].rstrip(), match.group(), separator)
+        return cls(raw, '', separator)
+
+    @property
+    def text(self):
+        if self._text is None:
+            text = ' '.join(self._words)
+            self._text = text.replace('\n ', '\n') if '\n' in text else text
+        return self._text
+
+    @text.setter
+    def text(self, value):
+        self._text = value
+        self._words = None
+        self.fixed = 0
+
+    @property
+    def words(self):
+        if self._words is None:
+            text = self._text
+            self._words = _LINE_WORD_RE.findall(text) if '\n' in text else text.split()
+        return self._words
+
+    @words.setter
+    def words(self, value):
+        self._words = value
+        self._text = None
+        self.fixed = 0
+
+    def rewrite(self, flag, function):
+        """Apply a deterministic rewrite unless the text is already its fixed point"""
+        if self.fixed & flag:
+            return
+        text = self.text
+        result = function(text)
+        if result == text:
+            self.fixed |= flag
+        else:
+            self.text = result
+
+    def render(self):
+        return self.text + self.terminal
+
+
+class Document:
+    """Sentence-segmented working copy of a text shared by all pipeline stages
+
+    Built once per humanize call; stages edit the sentences in place and the
+    string is only rendered at the end.
+    """
+
+    __slots__ = ('sentences',)
+
+    def __init__(self, sentences):
+        self.sentences = sentences
+
+    @classmethod
+    def from_segments(cls, source, segments):
+        """Wrap segmenter output, keeping the line breaks between sentences
+
+        Each sentence is located in the source; whitespace before it that
+        holds a line break is kept as its separator, any other gap renders
+        as a single space.
+        """
+        sentences = []
+        position = 0
+        for segment in segments:
+            separator = ' '
+            start = source.find(segment, position)
+            if start != -1:
+                gap = source[position:start]
+                if '\n' in gap and not gap.strip():
+                    separator = gap
+                position = start + len(segment)
+            sentences.append(Sentence.parse(segment, separator))
+        return cls(sentences)
+
+    def render(self):
+        parts = []
+        for sentence in self.sentences:
+            rendered = sentence.render()
+            if rendered:
+                if parts:
+                    parts.append(sentence.separator)
+                parts.append(rendered)
+        return ''.join(parts)
+
+
+class CompiledLexicon:
+    """Word and phrase tables together with the matchers compiled from them
+
+    Never modified once built: humanizers swap the whole object and every
+    call reads it once, so a swap cannot mix two lexicons within one call.
+    ``source_hash`` is the hex content hash of the source tables.
+    """
+
+    def __init__(self, tables, digest=None):
+        self.source_hash = (digest or source_hash(tables)).hex()
+        # Read-only views mapped from the lexicon artifact shared by every process
+        tables = load_tables(tables)
+        self.aggressive_replacements = tables['aggressive_replacements']
+        self.human_starters = tables['human_starters']
+        self.connectors = tables['connectors']
+        self.fillers = tables['fillers']
+        self.contractions = tables['contractions']
+        self.ai_patterns = tables['ai_patterns']
+        self.imperfection_rules = tables['imperfection_rules']
+
+        self.word_matcher = PhraseMatcher(self.aggressive_replacements)
+        self.contraction_matcher = PhraseMatcher(self.contractions)
+        self.ai_pattern_matcher = RuleMatcher(
+            [(pattern, '') for pattern in self.ai_patterns], suffix=r'\s*,?\s*'
+        )
+        self.imperfection_matcher = RuleMatcher(self.imperfection_rules)
+        self._chained = None
+
+    @staticmethod
+    def _compile_chained(table):
+        """Compile one pattern per entry for the chained replacement mode"""
+        return [
+            (re.compile(r'\b' + re.escape(formal) + r'\b', re.IGNORECASE), casual)
+            for formal, casual in table.items()
         ]
-        
-        # Contractions for natural speech
-        self.contractions = {
-            "do not": "don't", "does not": "doesn't", "did not": "didn't",
-            "will not": "won't", "would not": "wouldn't", "could not": "couldn't",
-            "should not": "shouldn't", "cannot": "can't", "must not": "mustn't",
-            "have not": "haven't", "has not": "hasn't", "had not": "hadn't",
-            "is not": "isn't", "are not": "aren't", "was not": "wasn't",
-            "were not": "weren't", "it is": "it's", "that is": "that's",
-            "there is": "there's", "here is": "here's", "what is": "what's",
-            "where is": "where's", "when is": "when's", "how is": "how's",
-            "who is": "who's", "I am": "I'm", "you are": "you're",
-            "we are": "we're", "they are": "they're", "I will": "I'll",
-            "you will": "you'll", "we will": "we'll", "they will": "they'll",
-            "I would": "I'd", "you would": "you'd", "we would": "we'd",
-            "they would": "they'd", "I have": "I've", "you have": "you've",
-            "we have": "we've", "they have": "they've"
+
+    def rewriters(self, chained=False):
+        """Return the (replace words, apply contractions) functions
+
+        In chained mode the entries are applied one at a time like the
+        original engine; those patterns are only compiled on first use.
+        """
+        if not chained:
+            return self.word_matcher.sub, self.contraction_matcher.sub
+        if self._chained is None:
+            self._chained = (
+                self._compile_chained(self.aggressive_replacements),
+                self._compile_chained(self.contractions),
+            )
+        lexicon, contractions = self._chained
+
+        def replace_words(text):
+            for pattern, casual in lexicon:
+                text = pattern.sub(casual, text)
+            return text
+
+        def apply_contractions(text):
+            for pattern, contraction in contractions:
+                text = pattern.sub(contraction, text)
+            return text
+
+        return replace_words, apply_contractions
+
+
+def compile_lexicon(packs=()):
+    """Return the process-wide CompiledLexicon for the built-in tables plus ``packs``
+
+    Pack files are re-read on every call, but compiling is keyed by the
+    content hash of the merged tables: unchanged packs reuse the compiled
+    lexicon, and concurrent callers wait for one compile instead of each
+    running their own. Raises ValueError for packs that do not compile.
+    """
+    tables = load_pack_tables(packs)
+    key = source_hash(tables)
+    with _lexicon_lock:
+        lexicon = _compiled_lexicons.get(key)
+        if lexicon is None:
+            lexicon = _compiled_lexicons[key] = CompiledLexicon(tables, key)
+            while len(_compiled_lexicons) > _MAX_COMPILED_LEXICONS:
+                _compiled_lexicons.popitem(last=False)
+        else:
+            _compiled_lexicons.move_to_end(key)
+    return lexicon
+
+
+def _table_property(name):
+    return property(lambda self: getattr(self.lexicon, name), doc=f"Current {name} table (read-only)")
+
+
+class AdvancedHumanizer:
+    SEGMENTERS = ('punkt', 'builtin')
+
+    # Tables of the current lexicon
+    aggressive_replacements = _table_property('aggressive_replacements')
+    human_starters = _table_property('human_starters')
+    connectors = _table_property('connectors')
+    fillers = _table_property('fillers')
+    contractions = _table_property('contractions')
+    ai_patterns = _table_property('ai_patterns')
+    imperfection_rules = _table_property('imperfection_rules')
+
+    def __init__(self, chained_replacements=False, segmenter='punkt', deterministic=False, packs=()):
+        if segmenter not in self.SEGMENTERS:
+            raise ValueError(
+                f"Unknown segmenter {segmenter!r}, expected one of {self.SEGMENTERS}"
+            )
+        # Sentence splitter: NLTK punkt or the built-in regex segmenter
+        self.segmenter = segmenter
+
+        # When True, calls without an explicit seed derive one from the text,
+        # so the same input always gives the same output
+        self.deterministic = deterministic
+
+        # Constructor arguments, used to build identical humanizers in workers
+        self._options = {
+            'chained_replacements': chained_replacements,
+            'segmenter': segmenter,
+            'deterministic': deterministic,
+            'packs': tuple(packs),
         }
-        
-        # AI-specific phrase patterns to break
-        self.ai_patterns = [
-            r'\bin conclusion\b', r'\bin summary\b', r'\bto summarize\b',
-            r'\bin essence\b', r'\bfurthermore\b', r'\bmoreover\b',
-            r'\badditionally\b', r'\bnevertheless\b', r'\bhowever\b',
-            r'\bconsequently\b', r'\btherefore\b', r'\bthus\b',
-            r'\bhence\b', r'\baccordingly\b', r'\bsubsequently\b'
-        ]
-        
-    def aggressive_humanize(self, text):
-        """Apply aggressive humanization techniques"""
-        
-        # Step 1: Replace formal words with casual ones
-        for formal, casual in self.aggressive_replacements.items():
-            # Word boundary replacement
-            pattern = r'\b' + re.escape(formal) + r'\b'
-            text = re.sub(pattern, casual, text, flags=re.IGNORECASE)
-        
-        # Step 2: Break up AI sentence patterns
+
+        # Resolve NLTK data on first use (cached for the whole process)
+        self._punkt_ready = segmenter == 'punkt' and ensure_nltk_data()
+
+        # When True, word replacements and contractions are applied one entry
+        # at a time like the original engine, so a replaced word can be
+        # replaced again ("various" -> "different" -> "unlike"). Useful to
+        # compare outputs.
+        self.chained_replacements = chained_replacements
+            
+        # Built-in tables (lexicon_tables.py) plus any JSON/TSV lexicon packs,
+        # compiled once per process and replaced as a whole by use_packs
+        self.lexicon = compile_lexicon(self._options['packs'])
+
+        # Per-stage timings, recorded only while stats.enabled is True
+        self.stats = StageStats(enabled=_env_flag('HUMANIZER_PROFILE'))
+
+    @property
+    def options(self):
+        """Constructor arguments of this humanizer"""
+        return dict(self._options)
+
+    def use_packs(self, packs):
+        """Swap in the built-in tables plus ``packs`` while the humanizer is in use
+
+        The new lexicon is fully compiled (or taken from the process cache)
+        before it replaces the old one in a single assignment; calls already
+        running finish with the lexicon they started with.
+        """
+        lexicon = compile_lexicon(packs)
+        self._options = dict(self._options, packs=tuple(packs))
+        self.lexicon = lexicon
+
+    def _make_rng(self, text, seed=None):
+        """Create the random generator for one call
+
+        An explicit ``seed`` always wins; otherwise deterministic humanizers
+        derive the seed from the text and the rest draw fresh entropy.
+        """
+        if seed is None and self.deterministic:
+            seed = int.from_bytes(hashlib.sha256(text.encode('utf-8')).digest()[:8], 'big')
+        return random.Random(seed)
+
+    def _split_sentences(self, text):
+        """Split text into sentences with the configured segmenter"""
+        if not self._punkt_ready:
+            return segment_sentences(text)
         try:
-            sentences = nltk.sent_tokenize(text)
+            import nltk
+            return nltk.sent_tokenize(text)
         except Exception as e:
-            # Fallback: simple sentence splitting
-            print(f"NLTK tokenization failed, using fallback: {e}")
-            sentences = self._fallback_sentence_split(text)
-        
-        humanized_sentences = []
+            # Fallback: built-in segmenter, which keeps the punctuation
+            print(f"NLTK tokenization failed, using fallback: {e}", file=sys.stderr)
+            return segment_sentences(text)
+
+    def _build_document(self, text):
+        """Tokenize the text once into the Document shared by every stage"""
+        return Document.from_segments(text, self._split_sentences(text))
+
+    def aggressive_humanize(self, text, rng=None, progress=None, plan=None, passes=1):
+        """Apply aggressive humanization techniques
+
+        ``plan`` is an ExecutionPlan from compile_plan (default: the full
+        pipeline). With ``passes`` > 1 the pipeline runs again on the same
+        Document, skipping deterministic rewrites that already reached a
+        fixed point, and stops early once a pass changes nothing.
+        ``progress(stage, fraction)`` is called as the PIPELINE_STAGES
+        complete, with the fraction of the whole run done so far. Stage
+        timings go to ``self.stats`` when it is enabled.
+        """
+        if rng is None:
+            rng = self._make_rng(text)
+        if plan is None:
+            plan = compile_plan()
+        lexicon = self.lexicon
+        replace_words, apply_contractions = lexicon.rewriters(self.chained_replacements)
+
+        stats = self.stats if self.stats.enabled else None
+        started = time.perf_counter() if stats is not None else 0.0
+        pass_index = 0
+
+        def advance(stage, done=1.0):
+            if progress is not None:
+                fraction = (PIPELINE_STAGES.index(stage) + done) / len(PIPELINE_STAGES)
+                progress(stage, (pass_index + fraction) / passes)
+
+        def finish(stage):
+            nonlocal started
+            if stats is not None:
+                started = stats.record(stage, started, len(text))
+            advance(stage)
+
+        def skip(stage):
+            nonlocal started
+            if stats is not None:
+                started = time.perf_counter()
+            advance(stage)
+
+        document = self._build_document(text)
+        sentences = document.sentences
+        finish('tokenize')
+        previous = document.render() if passes > 1 else None
         
-        for i, sentence in enumerate(sentences):
-            # Remove AI transition words at sentence starts
-            for pattern in self.ai_patterns:
-                sentence = re.sub(pattern + r'\s*,?\s*', '', sentence, flags=re.IGNORECASE)
+        for pass_index in range(passes):
+            if pass_index:
+                # The Document is reused, so later passes skip tokenization
+                skip('tokenize')
             
-            # Add human-like sentence starters (30% chance)
-            if random.random() < 0.3 and len(sentence.split()) > 3:
-                starter = random.choice(self.human_starters)
-                sentence = starter + sentence.lower()
+            # Step 1: Replace formal words with casual ones
+            for sentence in sentences:
+                sentence.rewrite(_FIXED_LEXICON, replace_words)
+            finish('lexicon')
             
-            # Add fillers within sentences (20% chance)
-            if random.random() < 0.2 and len(sentence.split()) > 5:
-                words = sentence.split()
-                insert_pos = random.randint(2, len(words) - 2)
-                filler = random.choice(self.fillers)
-                words.insert(insert_pos, filler + ",")
-                sentence = " ".join(words)
+            # Step 2: Break up AI sentence patterns
+            step = max(1, len(sentences) // _PROGRESS_STEPS)
+            for i, sentence in enumerate(sentences):
+                if progress is not None and i and i % step == 0:
+                    advance('sentences', i / len(sentences))
+                
+                # Remove AI transition words at sentence starts
+                sentence.rewrite(_FIXED_TRANSITIONS, lexicon.ai_pattern_matcher.sub)
+                
+                # Add human-like sentence starters (30% chance by default)
+                if rng.random() < plan.starter and len(sentence.words) > 3:
+                    starter = rng.choice(lexicon.human_starters)
+                    sentence.text = starter + sentence.text.lower()
+                
+                # Add fillers within sentences (20% chance by default)
+                if rng.random() < plan.filler and len(sentence.words) > 5:
+                    words = sentence.words
+                    insert_pos = rng.randint(2, len(words) - 2)
+                    filler = rng.choice(lexicon.fillers)
+                    words.insert(insert_pos, filler + ",")
+                    sentence.words = words
+                
+                # Replace connectors with casual ones
+                if i > 0 and rng.random() < plan.connector:
+                    sentence.text = rng.choice(lexicon.connectors) + ", " + sentence.text.lower()
+            finish('sentences')
             
-            # Replace connectors with casual ones
-            if i > 0 and random.random() < 0.4:
-                sentence = random.choice(self.connectors) + ", " + sentence.lower()
+            # Step 3: Apply contractions aggressively
+            if 'contractions' in plan.stages:
+                for sentence in sentences:
+                    sentence.rewrite(_FIXED_CONTRACTIONS, apply_contractions)
+                finish('contractions')
+            else:
+                skip('contractions')
             
-            humanized_sentences.append(sentence)
-        
-        text = " ".join(humanized_sentences)
-        
-        # Step 3: Apply contractions aggressively
-        for formal, contraction in self.contractions.items():
-            text = re.sub(r'\b' + re.escape(formal) + r'\b', contraction, text, flags=re.IGNORECASE)
-        
-        # Step 4: Add casual punctuation and expressions
-        text = self._add_casual_elements(text)
-        
-        # Step 5: Vary sentence structure
-        text = self._vary_sentence_structure(text)
-        
-        # Step 6: Add human imperfections
-        text = self._add_human_imperfections(text)
+            # Step 4: Add casual punctuation and expressions
+            if 'casual' in plan.stages:
+                self._add_casual_elements(document, rng, plan)
+                finish('casual')
+            else:
+                skip('casual')
+            
+            # Step 5: Vary sentence structure
+            if 'structure' in plan.stages:
+                self._vary_sentence_structure(document, rng, plan)
+                finish('structure')
+            else:
+                skip('structure')
+            
+            # Step 6: Add human imperfections
+            if 'imperfections' in plan.stages:
+                self._add_human_imperfections(document, rng, plan, lexicon)
+                finish('imperfections')
+            else:
+                skip('imperfections')
+            
+            # Stop once a pass leaves the document unchanged
+            if pass_index + 1 < passes:
+                rendered = document.render()
+                if rendered == previous:
+                    pass_index = passes - 1
+                    advance('imperfections')
+                    break
+                previous = rendered
         
-        return text.strip()
+        return document.render().strip()
     
-    def _add_casual_elements(self, text):
+    def _add_casual_elements(self, document, rng, plan):
         """Add casual punctuation and expressions"""
         
-        # Replace some periods with ellipses (10% chance)
-        sentences = text.split('. ')
-        for i in range(len(sentences)):
-            if random.random() < 0.1:
-                sentences[i] = sentences[i] + "..."
-            elif random.random() < 0.05:
-                sentences[i] = sentences[i] + "!"
+        # Only sentences closed by a period get casual punctuation
+        sentences = [
+            sentence for sentence in document.sentences
+            if sentence.terminal in ('.', '')
+        ]
         
-        text = '. '.join(sentences)
+        # Replace some periods with ellipses (10% chance by default)
+        for sentence in sentences:
+            if rng.random() < plan.ellipsis:
+                sentence.terminal = "..."
+            elif rng.random() < plan.exclamation:
+                sentence.terminal = "!"
         
         # Add casual expressions
         casual_additions = [
@@ -289,80 +834,212 @@ class AdvancedHumanizer:
             ", to be honest", ", let's be real", ", no joke", ", seriously"
         ]
         
-        sentences = text.split('. ')
-        for i in range(len(sentences)):
-            if random.random() < 0.15:
-                addition = random.choice(casual_additions)
-                sentences[i] = sentences[i] + addition
-        
-        return '. '.join(sentences)
+        for sentence in sentences:
+            if rng.random() < plan.casual_addition:
+                addition = rng.choice(casual_additions)
+                sentence.text = sentence.text + addition
     
-    def _vary_sentence_structure(self, text):
+    def _vary_sentence_structure(self, document, rng, plan):
         """Vary sentence structure to avoid AI patterns"""
         
-        sentences = nltk.sent_tokenize(text)
-        varied_sentences = []
-        
-        for sentence in sentences:
-            words = sentence.split()
+        for sentence in document.sentences:
+            words = sentence.words
             
             # Occasionally start with different structures
-            if len(words) > 4 and random.random() < 0.2:
+            if len(words) > 4 and rng.random() < plan.restructure:
                 # Move some elements around
                 if words[0].lower() in ['the', 'this', 'that', 'these', 'those']:
                     # Try to restructure
                     if 'is' in words or 'are' in words or 'was' in words or 'were' in words:
                         # Find the verb and potentially restructure
                         pass  # Keep original for now, could add more complex restructuring
-            
-            varied_sentences.append(sentence)
-        
-        return ' '.join(varied_sentences)
     
-    def _add_human_imperfections(self, text):
+    def _add_human_imperfections(self, document, rng, plan, lexicon):
         """Add subtle human-like imperfections"""
         
-        # Occasionally use less formal grammar
-        replacements = [
-            (r'\bwho are\b', 'that are'),
-            (r'\bwhich are\b', 'that are'),
-            (r'\bamong\b', 'between'),
-            (r'\bregarding\b', 'about'),
-            (r'\bconcerning\b', 'about'),
-            (r'\bprior to\b', 'before'),
-            (r'\bsubsequent to\b', 'after'),
-            (r'\bin order to\b', 'to'),
-            (r'\bdue to the fact that\b', 'because'),
-            (r'\bfor the reason that\b', 'because'),
-            (r'\bin spite of the fact that\b', 'even though'),
-            (r'\bnotwithstanding the fact that\b', 'even though')
-        ]
-        
-        for pattern, replacement in replacements:
-            if random.random() < 0.3:  # 30% chance to apply each
-                text = re.sub(pattern, replacement, text, flags=re.IGNORECASE)
+        # Occasionally use less formal grammar (30% chance to apply each rule by default)
+        active = {
+            index for index in range(len(lexicon.imperfection_rules))
+            if rng.random() < plan.imperfection
+        }
+        if not active:
+            return
         
-        return text
+        matcher = lexicon.imperfection_matcher
+        for sentence in document.sentences:
+            if sentence.fixed & _FIXED_IMPERFECTIONS:
+                continue
+            text = sentence.text
+            result, matched = matcher.apply(text, active)
+            if not matched:
+                sentence.fixed |= _FIXED_IMPERFECTIONS
+            elif result != text:
+                sentence.text = result
     
-    def _fallback_sentence_split(self, text):
-        """Fallback sentence splitting when NLTK fails"""
-        # Simple regex-based sentence splitting
-        import re
-        sentences = re.split(r'[.!?]+\s+', text)
-        # Clean up and filter
-        sentences = [s.strip() for s in sentences if s.strip()]
-        return sentences
-    
-    def humanize(self, text):
-        """Main humanization method"""
+    def humanize(self, text, seed=None, progress=None, mode=None, intensity=None, language=None, tone=None,
+                 passes=1, workers=1):
+        """Main humanization method
+
+        Pass ``seed`` (int or str) for reproducible output; every call uses
+        its own random generator, so concurrent calls do not interfere.
+        ``progress(stage, fraction)`` receives real pipeline progress.
+        ``mode``, ``intensity`` (1-10), ``language`` and ``tone`` select
+        the stages and rewrite rates, see compile_plan. ``passes`` runs the
+        pipeline up to that many times on one tokenized Document.
+
+        Paragraphs are humanized one by one and the line breaks in the text
+        are kept. Parallel work is opt-in: with ``workers`` > 1 (or None for
+        the CPU count), inputs of PARALLEL_THRESHOLD characters or more are
+        spread over a process pool that lives for the rest of the process.
+        The output does not depend on the worker count, but stage timings
+        recorded in the pool do not reach ``self.stats``.
+        """
+        plan = compile_plan(mode, intensity, language, tone)
+        if isinstance(passes, bool) or not isinstance(passes, int) or passes < 1:
+            raise ValueError(f"passes must be a positive integer, got {passes!r}")
         if not text or not text.strip():
             return text
-        
+        if workers is None:
+            workers = os.cpu_count() or 1
+        return self._humanize(text, self._make_rng(text, seed), progress, plan, passes, workers)
+
+    def _humanize(self, text, rng, progress=None, plan=None, passes=1, workers=1):
+        """Humanize with the given random generator"""
+        if not text or not text.strip():
+            return text
+
+        parts = _PARAGRAPH_SPLIT_RE.split(text.strip())
+        if len(parts) > 1:
+            return self._humanize_paragraphs(parts, rng, progress, plan, passes, workers)
+
         # Apply aggressive humanization
-        result = self.aggressive_humanize(text)
+        result = self.aggressive_humanize(text, rng, progress, plan, passes)
         
         # Ensure first letter is capitalized
         if result:
             result = result[0].upper() + result[1:] if len(result) > 1 else result.upper()
         
         return result
+
+    def _humanize_paragraphs(self, parts, rng, progress, plan, passes, workers):
+        """Humanize every paragraph of ``parts`` and join them with their separators
+
+        Each paragraph gets its own generator seeded from ``rng``, so serial
+        and parallel runs give the same output. Progress is reported as a
+        ``'paragraphs'`` stage.
+        """
+        paragraphs = parts[::2]
+        seeds = [rng.getrandbits(64) for _ in paragraphs]
+        total = sum(len(paragraph) for paragraph in paragraphs)
+
+        if workers > 1 and total >= PARALLEL_THRESHOLD:
+            from batch_humanizer import humanize_paragraphs
+            results = humanize_paragraphs(paragraphs, seeds, plan, passes, workers, self._options, progress)
+        else:
+            results = []
+            done = 0
+            reported = 0
+            for paragraph, seed in zip(paragraphs, seeds):
+                results.append(self._humanize(paragraph, random.Random(seed), None, plan, passes))
+                done += len(paragraph)
+                step = done * _PROGRESS_STEPS // total
+                if progress is not None and step > reported:
+                    reported = step
+                    progress('paragraphs', done / total)
+
+        parts[::2] = results
+        return ''.join(parts)
+
+    def humanize_stream(self, readable, window=64 * 1024, seed=None):
+        """Humanize a large text incrementally, yielding output as it is ready
+
+        ``readable`` is a file-like object (or a string). Input is read in
+        blocks of ``window`` characters and humanized one paragraph at a time;
+        paragraphs longer than the window are cut at the last sentence end.
+        Blank lines between paragraphs are preserved and peak memory depends
+        on the window size, not on the size of the input. One random
+        generator (seeded by ``seed``) is shared by the whole stream.
+        """
+        if isinstance(readable, str):
+            readable = io.StringIO(readable)
+        rng = random.Random(seed)
+
+        buffer = ''
+        # True while the buffer starts in the middle of a sentence
+        continuing = False
+        while True:
+            block = readable.read(window)
+            buffer += block
+
+            # Emit every complete paragraph; a break touching the end of the
+            # buffer may continue in the next block, so wait for more input
+            position = 0
+            for match in _PARAGRAPH_BREAK_RE.finditer(buffer):
+                if block and match.end() == len(buffer):
+                    break
+                paragraph = buffer[position:match.start()].strip()
+                yield self._humanize_piece(paragraph, continuing, rng) + match.group()
+                position = match.end()
+                continuing = False
+            buffer = buffer[position:]
+
+            if not block:
+                break
+
+            if len(buffer) >= window:
+                # Oversized paragraph: cut at the last sentence end
+                cut = 0
+                for match in _SENTENCE_END_RE.finditer(buffer):
+                    cut = match.end()
+                piece_continuing = continuing
+                continuing = not cut
+                if not cut:
+                    cut = max(buffer.rfind(' '), buffer.rfind('\n')) + 1 or len(buffer)
+                yield self._humanize_piece(buffer[:cut].strip(), piece_continuing, rng) + ' '
+                buffer = buffer[cut:]
+
+        if buffer.strip():
+            trailing = buffer[len(buffer.rstrip()):]
+            yield self._humanize_piece(buffer.strip(), continuing, rng) + trailing
+
+    def _humanize_piece(self, text, continuing, rng):
+        """Humanize a streamed piece, capitalizing it only at a sentence start"""
+        if continuing and text:
+            return self.aggressive_humanize(text, rng)
+        return self._humanize(text, rng)
+
+    def humanize_many(self, texts, workers=None, chunksize=8, return_exceptions=False, lazy=False, seed=None,
+                      settings=None):
+        """Humanize many texts on a process pool, returning results in input order
+
+        Each worker builds a humanizer with this instance's settings once at
+        startup. See batch_humanizer.humanize_many for the options.
+        """
+        from batch_humanizer import humanize_many
+        return humanize_many(
+            texts, workers=workers, chunksize=chunksize,
+            return_exceptions=return_exceptions, lazy=lazy, seed=seed, options=self._options,
+            settings=settings
+        )
+
+
+def get_shared_humanizer(**options):
+    """Return the process-wide AdvancedHumanizer for the given options
+
+    The engine is built once per distinct set of constructor options and
+    then shared. It keeps no per-call state (every call gets its own
+    Document and random generator), so one instance can serve any number of
+    threads; treat it as read-only.
+    """
+    bound = inspect.signature(AdvancedHumanizer).bind(**options)
+    bound.apply_defaults()
+    bound.arguments['packs'] = tuple(bound.arguments['packs'])
+    key = tuple(sorted(bound.arguments.items()))
+
+    humanizer = _shared_humanizers.get(key)
+    if humanizer is None:
+        with _shared_lock:
+            humanizer = _shared_humanizers.get(key)
+            if humanizer is None:
+                humanizer = _shared_humanizers[key] = AdvancedHumanizer(**bound.arguments)
+    return humanizer
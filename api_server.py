@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+"""
+Advanced AI Text Humanizer - HTTP API
+Asyncio JSON service running the humanizer on a pool of warm worker processes
+
+Endpoints:
+    GET  /health           -> {"status": "ok", ...}
+    POST /humanize         {"text": "...", "seed": 42}           -> {"text": "..."}
+    POST /humanize/batch   {"texts": ["...", "..."], "seed": 42} -> {"results": [{"text": "..."} | {"error": "..."}]}
+    POST /lexicon/reload   re-read the --pack files and swap them in -> {"lexicon": "<hash>", ...}
+
+The optional "seed" (integer or string) makes the output reproducible.
+
+Usage:
+    python api_server.py --port 8000 --workers 4 --pack packs/
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from http import HTTPStatus
+
+from advanced_humanizer import AdvancedHumanizer, compile_lexicon
+from batch_humanizer import humanize_chunk, init_worker
+
+# Longest request line plus headers accepted before answering 431
+MAX_HEADER_BYTES = 16 * 1024
+
+# Seconds an idle keep-alive connection may wait for its next request
+KEEP_ALIVE_TIMEOUT = 15
+
+
+class HTTPError(Exception):
+    """Error answered to the client with a JSON body"""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class HumanizerService:
+    """Runs humanize requests on a bounded process pool with admission control
+
+    At most ``max_concurrency`` requests run on the pool at once; up to
+    ``max_queue`` more wait for a slot and anything beyond that is answered
+    with 503 so overload does not turn into unbounded latency.
+    """
+
+    def __init__(self, workers=None, max_concurrency=None, max_queue=256,
+                 max_body_bytes=1024 * 1024, max_batch_items=256, batch_chunksize=8,
+                 options=None):
+        self.workers = workers or os.cpu_count() or 1
+        self.max_concurrency = max_concurrency or self.workers * 2
+        self.max_queue = max_queue
+        self.max_body_bytes = max_body_bytes
+        self.max_batch_items = max_batch_items
+        self.batch_chunksize = batch_chunksize
+        self.options = dict(options or {})
+        self.executor = None
+        self.lexicon_hash = None
+        self._slots = None
+        self._waiting = 0
+        self._reload_lock = None
+
+    def _start_pool(self):
+        """Start and warm a worker pool for the current options"""
+        # Compile the packs here first, so workers only map the cached artifact
+        compile_lexicon(self.options.get("packs", ()))
+        executor = ProcessPoolExecutor(
+            max_workers=self.workers, initializer=init_worker, initargs=(self.options,)
+        )
+        # Start every worker now rather than on the first requests
+        for future in [executor.submit(humanize_chunk, [], False) for _ in range(self.workers)]:
+            future.result()
+        return executor
+
+    def start(self):
+        """Start the worker pool; each worker builds and warms its humanizer"""
+        self.lexicon_hash = compile_lexicon(self.options.get("packs", ())).source_hash
+        self.executor = self._start_pool()
+        self._slots = asyncio.Semaphore(self.max_concurrency)
+        self._reload_lock = asyncio.Lock()
+
+    def close(self):
+        if self.executor is not None:
+            self.executor.shutdown()
+
+    async def reload_lexicon(self, payload=None):
+        """Re-read the lexicon packs and, if they changed, swap in a new pool
+
+        The new pool is started and warmed in the background while the old
+        one keeps serving; requests already running finish on the old pool,
+        which then shuts down.
+        """
+        loop = asyncio.get_running_loop()
+        packs = self.options.get("packs", ())
+        async with self._reload_lock:
+            try:
+                lexicon = await loop.run_in_executor(None, compile_lexicon, packs)
+            except (OSError, ValueError) as e:
+                raise HTTPError(HTTPStatus.BAD_REQUEST, f"Could not load lexicon packs: {e}")
+            digest = lexicon.source_hash
+            if digest == self.lexicon_hash:
+                return {"lexicon": digest, "packs": list(packs), "reloaded": False}
+
+            executor = await loop.run_in_executor(None, self._start_pool)
+            old, self.executor = self.executor, executor
+            self.lexicon_hash = digest
+            old.shutdown(wait=False)
+            return {"lexicon": digest, "packs": list(packs), "reloaded": True}
+
+    async def _run(self, texts, seed=None):
+        """Humanize a list of texts on the pool, returning results or exceptions"""
+        if self._slots.locked() and self._waiting >= self.max_queue:
+            raise HTTPError(HTTPStatus.SERVICE_UNAVAILABLE, "Server busy, retry later")
+
+        self._waiting += 1
+        try:
+            await self._slots.acquire()
+        finally:
+            self._waiting -= 1
+
+        loop = asyncio.get_running_loop()
+        try:
+            chunks = [texts[i:i + self.batch_chunksize] for i in range(0, len(texts), self.batch_chunksize)]
+            parts = await asyncio.gather(*(
+                loop.run_in_executor(self.executor, humanize_chunk, chunk, True, seed) for chunk in chunks
+            ))
+        finally:
+            self._slots.release()
+        return [result for part in parts for result in part]
+
+    @staticmethod
+    def _seed(payload):
+        seed = payload.get("seed")
+        if seed is not None and (isinstance(seed, bool) or not isinstance(seed, (int, str))):
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "'seed' must be an integer or a string")
+        return seed
+
+    async def humanize(self, payload):
+        text = payload.get("text") if isinstance(payload, dict) else None
+        if not isinstance(text, str):
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Expected a JSON object with a 'text' string")
+        result, = await self._run([text], self._seed(payload))
+        if isinstance(result, Exception):
+            raise HTTPError(HTTPStatus.INTERNAL_SERVER_ERROR, f"Humanization failed: {result}")
+        return {"text": result}
+
+    async def humanize_batch(self, payload):
+        texts = payload.get("texts") if isinstance(payload, dict) else None
+        if not isinstance(texts, list) or not all(isinstance(text, str) for text in texts):
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Expected a JSON object with a 'texts' list of strings")
+        if len(texts) > self.max_batch_items:
+            raise HTTPError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, f"At most {self.max_batch_items} texts per batch")
+        results = await self._run(texts, self._seed(payload))
+        return {"results": [
+            {"error": str(result)} if isinstance(result, Exception) else {"text": result}
+            for result in results
+        ]}
+
+    def health(self):
+        return {
+            "status": "ok",
+            "workers": self.workers,
+            "max_concurrency": self.max_concurrency,
+            "waiting": self._waiting,
+            "lexicon": self.lexicon_hash,
+        }
+
+
+class HTTPServer:
+    """Minimal HTTP/1.1 front end (JSON bodies, keep-alive) for HumanizerService"""
+
+    def __init__(self, service):
+        self.service = service
+        self.routes = {
+            ("GET", "/health"): None,
+            ("POST", "/humanize"): service.humanize,
+            ("POST", "/humanize/batch"): service.humanize_batch,
+            ("POST", "/lexicon/reload"): service.reload_lexicon,
+        }
+
+    async def handle_connection(self, reader, writer):
+        try:
+            while True:
+                try:
+                    head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), KEEP_ALIVE_TIMEOUT)
+                except (asyncio.IncompleteReadError, asyncio.TimeoutError, ConnectionError):
+                    break
+                except asyncio.LimitOverrunError:
+                    await self._respond(writer, HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE,
+                                        {"error": "Request headers too large"}, keep_alive=False)
+                    break
+
+                try:
+                    keep_alive = await self._handle_request(head, reader, writer)
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    break
+                if not keep_alive:
+                    break
+        finally:
+            writer.close()
+
+    async def _handle_request(self, head, reader, writer):
+        """Parse and answer one request, returning whether to keep the connection"""
+        lines = head.decode("latin-1").split("\r\n")
+        try:
+            method, path, version = lines[0].split(" ", 2)
+        except ValueError:
+            await self._respond(writer, HTTPStatus.BAD_REQUEST, {"error": "Malformed request line"}, keep_alive=False)
+            return False
+
+        headers = {}
+        for line in lines[1:]:
+            name, _, value = line.partition(":")
+            if name:
+                headers[name.strip().lower()] = value.strip()
+        keep_alive = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+
+        try:
+            length = int(headers.get("content-length", "0"))
+            if length < 0:
+                raise ValueError(length)
+        except ValueError:
+            await self._respond(writer, HTTPStatus.BAD_REQUEST, {"error": "Invalid Content-Length"}, keep_alive=False)
+            return False
+        if length > self.service.max_body_bytes:
+            # The body is not read, so the connection cannot be reused
+            await self._respond(writer, HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                                {"error": f"Request body exceeds {self.service.max_body_bytes} bytes"}, keep_alive=False)
+            return False
+        body = await reader.readexactly(length) if length else b""
+
+        path = path.split("?", 1)[0]
+        try:
+            status, payload = HTTPStatus.OK, await self._dispatch(method, path, body)
+        except HTTPError as e:
+            status, payload = e.status, {"error": e.message}
+        except Exception as e:
+            status, payload = HTTPStatus.INTERNAL_SERVER_ERROR, {"error": f"Internal error: {e}"}
+
+        await self._respond(writer, status, payload, keep_alive)
+        return keep_alive
+
+    async def _dispatch(self, method, path, body):
+        if (method, path) not in self.routes:
+            if any(route_path == path for _, route_path in self.routes):
+                raise HTTPError(HTTPStatus.METHOD_NOT_ALLOWED, f"{method} not allowed on {path}")
+            raise HTTPError(HTTPStatus.NOT_FOUND, f"No route for {path}")
+
+        handler = self.routes[(method, path)]
+        if handler is None:
+            return self.service.health()
+        try:
+            payload = json.loads(body or b"null")
+        except ValueError:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Request body is not valid JSON")
+        return await handler(payload)
+
+    async def _respond(self, writer, status, payload, keep_alive):
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        head = (
+            f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+            "Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+        )
+        writer.write(head.encode("latin-1") + body)
+        try:
+            await writer.drain()
+        except ConnectionError:
+            pass
+
+
+async def serve(host, port, service):
+    """Start the worker pool and serve HTTP until cancelled"""
+    service.start()
+    server = await asyncio.start_server(
+        HTTPServer(service).handle_connection, host, port, limit=MAX_HEADER_BYTES
+    )
+    print(f"🧠 Humanizer API listening on http://{host}:{port} ({service.workers} workers)")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        service.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="🧠 Advanced AI Text Humanizer - HTTP API")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to bind (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=int(os.environ.get("PORT", 8000)), help="Port (default: $PORT or 8000)")
+    parser.add_argument("--workers", type=int, help="Worker processes (default: CPU count)")
+    parser.add_argument("--max-concurrency", type=int, help="Requests running at once (default: 2 x workers)")
+    parser.add_argument("--max-queue", type=int, default=256, help="Requests waiting for a slot before answering 503")
+    parser.add_argument("--max-body-bytes", type=int, default=1024 * 1024, help="Largest accepted request body")
+    parser.add_argument("--max-batch-items", type=int, default=256, help="Most texts accepted per batch request")
+    parser.add_argument("--segmenter", choices=AdvancedHumanizer.SEGMENTERS, default="punkt", help="Sentence segmenter (default: punkt)")
+    parser.add_argument("--pack", dest="packs", action="append", default=[], help="Lexicon pack file or directory (.json/.tsv); repeatable, reloaded by POST /lexicon/reload")
+    args = parser.parse_args(argv)
+    try:
+        compile_lexicon(args.packs)
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 2
+
+    service = HumanizerService(
+        workers=args.workers,
+        max_concurrency=args.max_concurrency,
+        max_queue=args.max_queue,
+        max_body_bytes=args.max_body_bytes,
+        max_batch_items=args.max_batch_items,
+        options={"segmenter": args.segmenter, "packs": tuple(args.packs)},
+    )
+    try:
+        asyncio.run(serve(args.host, args.port, service))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Batch Humanization
+Runs AdvancedHumanizer over many documents on a pool of warm worker processes
+"""
+
+import itertools
+import os
+import random
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from advanced_humanizer import get_shared_humanizer
+
+# Humanizer built once per worker process by init_worker
+_worker_humanizer = None
+
+# Chunks kept in flight per worker when consuming an iterator of inputs
+_PREFETCH_PER_WORKER = 2
+
+# Long-lived pools for paragraph-parallel humanize calls, keyed by worker count
+_paragraph_pools = {}
+_paragraph_pools_lock = threading.Lock()
+
+# Paragraph chunks submitted per worker, so uneven paragraphs still balance
+_CHUNKS_PER_WORKER = 4
+
+
+def init_worker(options):
+    """Build the worker's humanizer and load its sentence tokenizer up front"""
+    global _worker_humanizer
+    _worker_humanizer = get_shared_humanizer(**options)
+    _worker_humanizer.humanize("Warm up the sentence tokenizer. It only loads once.")
+
+
+def _humanize_each(humanizer, texts, return_exceptions, seed, settings):
+    """Yield each text humanized by ``humanizer``, or its exception"""
+    settings = settings or {}
+    for text in texts:
+        try:
+            yield humanizer.humanize(text, seed, workers=1, **settings)
+        except Exception as e:
+            if not return_exceptions:
+                raise
+            yield e
+
+
+def humanize_chunk(texts, return_exceptions, seed=None, settings=None):
+    """Humanize a chunk of texts inside a worker process"""
+    return list(_humanize_each(_worker_humanizer, texts, return_exceptions, seed, settings))
+
+
+def humanize_paragraph_chunk(items, plan, passes):
+    """Humanize (paragraph, seed) pairs inside a worker process"""
+    return [
+        _worker_humanizer._humanize(paragraph, random.Random(seed), None, plan, passes)
+        for paragraph, seed in items
+    ]
+
+
+def _paragraph_pool(workers, options):
+    """Return the shared pool for ``workers``, rebuilding it when the options change"""
+    with _paragraph_pools_lock:
+        pool, pool_options = _paragraph_pools.get(workers, (None, None))
+        if pool is None or pool_options != options:
+            if pool is not None:
+                pool.shutdown(wait=False)
+            pool = ProcessPoolExecutor(max_workers=workers, initializer=init_worker, initargs=(options,))
+            _paragraph_pools[workers] = (pool, options)
+        return pool
+
+
+def humanize_paragraphs(paragraphs, seeds, plan, passes, workers, options, progress=None):
+    """Humanize the paragraphs of one document in parallel, in input order
+
+    Paragraphs are grouped into runs of similar size and sent to a pool
+    that stays warm between calls. ``progress(stage, fraction)`` is called
+    as runs complete.
+    """
+    target = max(1, sum(map(len, paragraphs)) // (workers * _CHUNKS_PER_WORKER))
+    chunks = []
+    chunk = []
+    size = 0
+    for paragraph, seed in zip(paragraphs, seeds):
+        chunk.append((paragraph, seed))
+        size += len(paragraph)
+        if size >= target:
+            chunks.append(chunk)
+            chunk = []
+            size = 0
+    if chunk:
+        chunks.append(chunk)
+
+    pool = _paragraph_pool(workers, options)
+    try:
+        futures = [pool.submit(humanize_paragraph_chunk, chunk, plan, passes) for chunk in chunks]
+        results = []
+        for future in futures:
+            results.extend(future.result())
+            if progress is not None:
+                progress('paragraphs', len(results) / len(paragraphs))
+    except BrokenProcessPool:
+        # Drop the dead pool so the next call starts a fresh one
+        with _paragraph_pools_lock:
+            if _paragraph_pools.get(workers, (None,))[0] is pool:
+                del _paragraph_pools[workers]
+        raise
+    return results
+
+
+def _chunked(iterable, size):
+    """Yield lists of up to ``size`` items, consuming the iterable lazily"""
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def iter_humanize(texts, workers=None, chunksize=8, return_exceptions=False, seed=None, options=None,
+                  settings=None):
+    """Humanize an iterable of texts in parallel, yielding results in input order
+
+    Inputs are read lazily: only a couple of chunks per worker are in flight,
+    so an unbounded iterator can be streamed through the pool. With
+    ``return_exceptions`` a failing item yields its exception instead of
+    aborting the whole batch. Every item is humanized with ``seed``, so a
+    seeded batch gives the same output whatever the worker count.
+    ``settings`` are humanize keyword arguments (mode, intensity, ...).
+    """
+    options = dict(options or {})
+    workers = workers or os.cpu_count() or 1
+    chunksize = max(1, chunksize)
+
+    if workers == 1:
+        # No pool for a single worker; the humanizer stays local so
+        # concurrent callers never share the worker global
+        humanizer = get_shared_humanizer(**options)
+        yield from _humanize_each(humanizer, texts, return_exceptions, seed, settings)
+        return
+
+    chunks = _chunked(texts, chunksize)
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker, initargs=(options,)) as pool:
+        pending = deque(
+            pool.submit(humanize_chunk, chunk, return_exceptions, seed, settings)
+            for chunk in itertools.islice(chunks, workers * _PREFETCH_PER_WORKER)
+        )
+        try:
+            while pending:
+                results = pending.popleft().result()
+                for chunk in itertools.islice(chunks, 1):
+                    pending.append(pool.submit(humanize_chunk, chunk, return_exceptions, seed, settings))
+                yield from results
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def humanize_many(texts, workers=None, chunksize=8, return_exceptions=False, lazy=False, seed=None, options=None,
+                  settings=None):
+    """Humanize many texts on a process pool, returning results in input order
+
+    ``workers`` defaults to the CPU count and ``chunksize`` sets how many
+    texts each task carries. With ``lazy=True`` a generator is returned that
+    consumes ``texts`` incrementally instead of building the whole list.
+    ``seed`` and ``settings`` are passed to every humanize call and
+    ``options`` are the AdvancedHumanizer constructor arguments.
+    """
+    results = iter_humanize(texts, workers, chunksize, return_exceptions, seed, options, settings)
+    return results if lazy else list(results)
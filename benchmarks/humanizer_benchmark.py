@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+"""
+Humanizer Benchmark Suite
+Measures humanize throughput, per-stage time, peak memory and startup time
+on a deterministic synthetic corpus, and compares the results to a baseline.
+Also checks that the fused rule matchers beat applying their rules one by one
+
+Usage:
+    python benchmarks/humanizer_benchmark.py                          # run, print a table
+    python benchmarks/humanizer_benchmark.py --output results.json    # also save JSON
+    python benchmarks/humanizer_benchmark.py --save-baseline          # store benchmarks/baseline.json
+    python benchmarks/humanizer_benchmark.py --compare --threshold 0.2
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import re
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from example_texts import DEFAULT_EXAMPLE, SAMPLE_SENTENCES
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+# Corpus sizes: word counts ("100w") or encoded sizes ("64KB", "1MB")
+DEFAULT_SIZES = ["10w", "100w", "1000w", "10000w", "1MB"]
+
+# Shortest wall time of one timing sample; small inputs are looped to reach it
+MIN_SAMPLE_SECONDS = 0.05
+
+# Baseline timings below this are too noisy to flag as regressions
+NOISE_FLOOR_SECONDS = 0.0005
+
+# Corpus the fused rule matchers are timed on
+MATCHER_CORPUS = "256KB"
+
+_SIZE_RE = re.compile(r"^(\d+)(w|KB|MB)$", re.IGNORECASE)
+
+
+def parse_size(spec):
+    """Turn "100w" into ("words", 100) and "1MB" into ("bytes", 1048576)"""
+    match = _SIZE_RE.match(spec)
+    if not match:
+        raise argparse.ArgumentTypeError(f"Invalid size {spec!r}, expected e.g. 100w, 64KB or 1MB")
+    amount, unit = int(match.group(1)), match.group(2).upper()
+    if unit == "W":
+        return "words", amount
+    return "bytes", amount * (1024 if unit == "KB" else 1024 * 1024)
+
+
+def generate_corpus(spec, seed=0):
+    """Build a deterministic document from the example sentences
+
+    Sentences are drawn with a seeded generator and grouped into paragraphs
+    of three to six sentences. The text is cut at the word count, or stops
+    once the UTF-8 size is reached, so the same spec always gives the same
+    document.
+    """
+    unit, amount = parse_size(spec)
+    rng = random.Random(seed)
+    sentences = SAMPLE_SENTENCES + [DEFAULT_EXAMPLE]
+
+    paragraphs = []
+    words = 0
+    size = 0
+    while (words if unit == "words" else size) < amount:
+        paragraph = " ".join(rng.choice(sentences) for _ in range(rng.randint(3, 6)))
+        paragraphs.append(paragraph)
+        words += len(paragraph.split())
+        size += len(paragraph.encode("utf-8")) + 2
+
+    text = "\n\n".join(paragraphs)
+    if unit == "words":
+        # Trim to the exact word count, keeping whitespace between the words
+        ends = [match.end() for match in re.finditer(r"\S+", text)]
+        text = text[:ends[amount - 1]]
+    return text
+
+
+def time_call(function, min_seconds=MIN_SAMPLE_SECONDS):
+    """Return how many calls make up one sample of at least ``min_seconds``"""
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            function()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_seconds:
+            return loops
+        loops *= 10 if elapsed < min_seconds / 10 else 2
+
+
+def measure_startup(segmenter, repeat):
+    """Best wall time of a fresh interpreter importing and building the humanizer"""
+    scripts = {
+        "interpreter_s": "pass",
+        "import_s": "import advanced_humanizer",
+        "construct_s": f"import advanced_humanizer; advanced_humanizer.AdvancedHumanizer(segmenter={segmenter!r})",
+    }
+    results = {}
+    for name, script in scripts.items():
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            subprocess.run([sys.executable, "-c", script], cwd=ROOT, check=True,
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            best = min(best, time.perf_counter() - start)
+        results[name] = best
+    # Report module cost on top of the bare interpreter
+    results["import_s"] = max(results["import_s"] - results["interpreter_s"], 0.0)
+    results["construct_s"] = max(results["construct_s"] - results["interpreter_s"], 0.0)
+    return results
+
+
+def measure_size(humanizer, spec, repeat):
+    """Throughput, per-stage time and peak memory for one corpus size"""
+    text = generate_corpus(spec)
+
+    def run():
+        humanizer.humanize(text, seed=0)
+
+    loops = time_call(run)
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(loops):
+            run()
+        samples.append((time.perf_counter() - start) / loops)
+    best = min(samples)
+
+    # Stage breakdown from the engine's own instrumentation
+    humanizer.stats.reset()
+    humanizer.stats.enabled = True
+    try:
+        for _ in range(loops):
+            run()
+    finally:
+        humanizer.stats.enabled = False
+    # Per document: paragraphs are recorded as separate calls
+    stages = {stage: row["seconds"] / loops for stage, row in humanizer.stats.snapshot().items()}
+    humanizer.stats.reset()
+
+    tracemalloc.start()
+    try:
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    words = len(text.split())
+    return {
+        "words": words,
+        "chars": len(text),
+        "loops": loops,
+        "best_s": best,
+        "mean_s": sum(samples) / len(samples),
+        "words_per_s": words / best,
+        "chars_per_s": len(text) / best,
+        "peak_bytes": peak,
+        "stages_s": stages,
+    }
+
+
+def best_time(function, repeat):
+    """Best wall time of ``repeat`` calls"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def measure_matchers(repeat):
+    """Time each fused RuleMatcher against a loop of one re.sub per rule
+
+    Transition removal runs per sentence and imperfections over the whole
+    text, the way the pipeline uses them.
+    """
+    from advanced_humanizer import compile_lexicon
+    from sentence_segmenter import segment_sentences
+
+    lexicon = compile_lexicon()
+    text = generate_corpus(MATCHER_CORPUS)
+    sentences = segment_sentences(text)
+
+    transition_rules = [(re.compile(pattern + r"\s*,?\s*", re.IGNORECASE), "") for pattern in lexicon.ai_patterns]
+    imperfection_rules = [(re.compile(pattern, re.IGNORECASE), replacement)
+                          for pattern, replacement in lexicon.imperfection_rules]
+
+    def loop(rules, text):
+        for pattern, replacement in rules:
+            text = pattern.sub(replacement, text)
+        return text
+
+    cases = {
+        "transitions": (
+            lambda: [lexicon.ai_pattern_matcher.sub(sentence) for sentence in sentences],
+            lambda: [loop(transition_rules, sentence) for sentence in sentences],
+        ),
+        "imperfections": (
+            lambda: lexicon.imperfection_matcher.sub(text),
+            lambda: loop(imperfection_rules, text),
+        ),
+    }
+    return {
+        name: {"fused_s": best_time(fused, repeat), "loop_s": best_time(per_rule, repeat)}
+        for name, (fused, per_rule) in cases.items()
+    }
+
+
+def run_benchmarks(args):
+    from advanced_humanizer import AdvancedHumanizer
+
+    results = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "segmenter": args.segmenter,
+            "repeat": args.repeat,
+        },
+        "startup": measure_startup(args.segmenter, args.startup_repeat),
+        "sizes": {},
+    }
+
+    humanizer = AdvancedHumanizer(segmenter=args.segmenter)
+    humanizer.humanize("Warm up the sentence tokenizer. It only loads once.", seed=0)
+    for spec in args.sizes:
+        results["sizes"][spec] = measure_size(humanizer, spec, args.repeat)
+        print_size(spec, results["sizes"][spec])
+
+    results["matchers"] = measure_matchers(args.repeat)
+    for name, row in results["matchers"].items():
+        print(f"matcher {name}: fused {row['fused_s'] * 1000:.2f} ms | per-rule loop {row['loop_s'] * 1000:.2f} ms")
+    return results
+
+
+def print_size(spec, row):
+    stages = ", ".join(f"{stage} {seconds * 1000:.2f}" for stage, seconds in row["stages_s"].items())
+    print(
+        f"{spec:>7}: {row['best_s'] * 1000:10.2f} ms | {row['words_per_s']:>10.0f} words/s | "
+        f"{row['chars_per_s'] / 1e6:6.2f} MB/s | peak {row['peak_bytes'] / 1e6:7.2f} MB"
+    )
+    print(f"         stages (ms): {stages}")
+
+
+def flatten(results):
+    """Map every "lower is better" metric to a dotted name"""
+    metrics = {f"startup.{name}": value for name, value in results["startup"].items()}
+    for spec, row in results["sizes"].items():
+        metrics[f"{spec}.best_s"] = row["best_s"]
+        metrics[f"{spec}.peak_bytes"] = row["peak_bytes"]
+        for stage, seconds in row["stages_s"].items():
+            metrics[f"{spec}.stage.{stage}_s"] = seconds
+    for name, row in results.get("matchers", {}).items():
+        metrics[f"matchers.{name}.fused_s"] = row["fused_s"]
+    return metrics
+
+
+def compare(results, baseline, threshold):
+    """Print metrics that got worse than the baseline and return their names"""
+    current = flatten(results)
+    regressions = []
+    for name, before in sorted(flatten(baseline).items()):
+        after = current.get(name)
+        if after is None or before <= 0:
+            continue
+        if name.endswith("_s") and before < NOISE_FLOOR_SECONDS:
+            continue
+        change = after / before - 1
+        if change > threshold:
+            regressions.append(name)
+            print(f"❌ {name}: {before:.6g} → {after:.6g} ({change:+.1%})")
+        elif abs(change) > threshold:
+            print(f"✅ {name}: {before:.6g} → {after:.6g} ({change:+.1%})")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark AdvancedHumanizer on a synthetic corpus")
+    parser.add_argument("--sizes", nargs="+", default=DEFAULT_SIZES, help=f"Corpus sizes (default: {' '.join(DEFAULT_SIZES)})")
+    parser.add_argument("--repeat", type=int, default=5, help="Timing samples per size (best is compared)")
+    parser.add_argument("--startup-repeat", type=int, default=5, help="Fresh interpreters started per startup metric")
+    parser.add_argument("--segmenter", choices=("punkt", "builtin"), default="builtin", help="Sentence segmenter (default: builtin)")
+    parser.add_argument("--output", "-o", help="Write the results to this JSON file")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline JSON file (default: benchmarks/baseline.json)")
+    parser.add_argument("--save-baseline", action="store_true", help="Store these results as the new baseline")
+    parser.add_argument("--compare", action="store_true", help="Compare against the baseline; exit 1 on regressions")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed slowdown before a metric is a regression (default: 0.2 = 20%%)")
+    args = parser.parse_args()
+    for spec in args.sizes:
+        parse_size(spec)
+
+    results = run_benchmarks(args)
+    startup = results["startup"]
+    print(f"startup: interpreter {startup['interpreter_s'] * 1000:.0f} ms, "
+          f"+ import {startup['import_s'] * 1000:.0f} ms, + construct {startup['construct_s'] * 1000:.0f} ms")
+
+    slower = [name for name, row in results["matchers"].items() if row["fused_s"] >= row["loop_s"]]
+    for name in slower:
+        print(f"❌ fused {name} matcher is not faster than its per-rule loop")
+
+    for path in filter(None, [args.output, args.baseline if args.save_baseline else None]):
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump(results, handle, indent=2)
+        print(f"💾 Results written to {path}")
+
+    if args.compare:
+        if not os.path.exists(args.baseline):
+            print(f"No baseline at {args.baseline}; run with --save-baseline first")
+            return 2
+        with open(args.baseline, encoding="utf-8") as handle:
+            baseline = json.load(handle)
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"{len(regressions)} metrics regressed by more than {args.threshold:.0%}")
+            return 1
+        print(f"No regressions beyond {args.threshold:.0%}")
+    return 1 if slower else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
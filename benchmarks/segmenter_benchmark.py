@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Sentence Segmenter Benchmark
+Compares the built-in segmenter against NLTK punkt for speed and agreement
+
+Usage:
+    python benchmarks/segmenter_benchmark.py [--corpus FILE ...] [--repeat N]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sentence_segmenter import segment_sentences
+
+# Reference corpus: everyday prose plus the cases that trip up regex splitters
+REFERENCE_CORPUS = [
+    "The implementation of advanced machine learning algorithms has demonstrated significant improvements in operational efficiency. Cost reduction metrics improved across multiple organizational departments.",
+    "Dr. Smith joined the team in 2019. She previously worked with Prof. Jones at the U.S. Department of Energy. Their results were published in Vol. 12 of the journal.",
+    "Is the model reliable? Nobody knows yet! The evaluation, which took approx. 3 weeks, is still ongoing.",
+    "Mr. J. R. Miller said, \"We are done.\" Then he left. The meeting ended at 5 p.m. sharp.",
+    "Several tools were compared, e.g. spreadsheets, databases, etc. The database won. It was faster... much faster.",
+    "Furthermore, the utilization of sophisticated computational methodologies facilitates enhanced data processing capabilities. Analysts, i.e. the end users, reported fewer errors.",
+    "Revenue grew by 4.5% in Q3. Expenses stayed flat (see Fig. 2). The board approved the plan.",
+    "The optimization process requires careful consideration of multiple parameters. Subsequently, the comprehensive analysis indicates substantial improvements. In conclusion, the approach works.",
+]
+
+
+def load_corpus(paths):
+    """Load corpus documents from files, or use the reference corpus"""
+    if not paths:
+        return list(REFERENCE_CORPUS)
+    documents = []
+    for path in paths:
+        with open(path, encoding="utf-8") as handle:
+            documents.extend(part for part in handle.read().split("\n\n") if part.strip())
+    return documents
+
+
+def boundaries(text, sentences):
+    """Map sentences back to the set of end offsets in the source text"""
+    ends = set()
+    position = 0
+    for sentence in sentences:
+        start = text.find(sentence, position)
+        if start == -1:
+            continue
+        position = start + len(sentence)
+        ends.add(position)
+    return ends
+
+
+def time_segmenter(segment, documents, repeat):
+    """Return the best per-pass wall time of a segmenter over the corpus"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for document in documents:
+            segment(document)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the built-in sentence segmenter against NLTK punkt")
+    parser.add_argument("--corpus", nargs="*", help="Text files to use instead of the reference corpus (paragraphs split on blank lines)")
+    parser.add_argument("--repeat", type=int, default=20, help="Timing repetitions (best run is reported)")
+    args = parser.parse_args()
+
+    documents = load_corpus(args.corpus)
+    total_chars = sum(len(document) for document in documents)
+    print(f"Corpus: {len(documents)} documents, {total_chars} characters")
+
+    builtin_time = time_segmenter(segment_sentences, documents, args.repeat)
+    print(f"builtin: {builtin_time * 1000:.2f} ms/pass ({total_chars / builtin_time / 1e6:.1f} MB/s)")
+
+    try:
+        start = time.perf_counter()
+        import nltk
+        nltk.sent_tokenize("Warm up. Load the model.")
+        load_time = time.perf_counter() - start
+    except ImportError:
+        print("nltk is not installed, skipping the punkt comparison")
+        return 0
+    except LookupError:
+        print("punkt data not found (python -c \"import nltk; nltk.download('punkt_tab')\"), skipping the punkt comparison")
+        return 0
+
+    punkt_time = time_segmenter(nltk.sent_tokenize, documents, args.repeat)
+    print(f"punkt:   {punkt_time * 1000:.2f} ms/pass (import + model load {load_time * 1000:.0f} ms)")
+    print(f"speedup: {punkt_time / builtin_time:.1f}x")
+
+    # Agreement on sentence end offsets, taking punkt as the reference
+    matched = predicted = expected = 0
+    for document in documents:
+        reference = boundaries(document, nltk.sent_tokenize(document))
+        candidate = boundaries(document, segment_sentences(document))
+        matched += len(reference & candidate)
+        predicted += len(candidate)
+        expected += len(reference)
+
+    precision = matched / predicted if predicted else 1.0
+    recall = matched / expected if expected else 1.0
+    f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+    print(f"agreement: precision {precision:.3f}, recall {recall:.3f}, F1 {f1:.3f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+Example Texts
+AI-style sample passages shared by the app and the benchmarks
+"""
+
+# Shown by the "💡 Example" button
+DEFAULT_EXAMPLE = "The implementation of this advanced methodology will facilitate significant optimization and subsequently demonstrate substantial improvements in performance metrics through sophisticated algorithmic processing."
+
+# Picked from by the "🎲 Random" button
+SAMPLE_SENTENCES = [
+    "The implementation of advanced machine learning algorithms has demonstrated significant improvements in operational efficiency and cost reduction metrics across multiple organizational departments.",
+    "Furthermore, the utilization of sophisticated computational methodologies facilitates enhanced data processing capabilities and enables more comprehensive analytical frameworks.",
+    "The optimization process requires careful consideration of multiple parameters to ensure maximum performance while maintaining system stability and resource efficiency.",
+    "Subsequently, the comprehensive analysis indicates that substantial improvements can be attributed to the strategic implementation of innovative technological solutions.",
+    "The deployment of artificial intelligence systems necessitates thorough evaluation of computational requirements and scalability considerations for optimal performance."
+]
+
+# Cards in the "Try These Examples" section
+EXAMPLE_TEMPLATES = [
+    {
+        "title": "📚 Academic Paper",
+        "text": SAMPLE_SENTENCES[0],
+        "icon": "🎓"
+    },
+    {
+        "title": "⚙️ Technical Documentation",
+        "text": SAMPLE_SENTENCES[1],
+        "icon": "💻"
+    },
+    {
+        "title": "💼 Business Report",
+        "text": SAMPLE_SENTENCES[2],
+        "icon": "📊"
+    }
+]
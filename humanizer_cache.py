@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Humanizer Result Cache
+Content-addressed cache of humanize results with an in-memory LRU tier and
+an optional SQLite tier on disk
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+# Fraction of max_disk_bytes kept after an eviction round
+_DISK_EVICTION_TARGET = 0.9
+
+# Bumped whenever the key material changes, so older disk entries stop matching
+CACHE_KEY_VERSION = 2
+
+
+def cache_key(text, seed=None, settings=None):
+    """Hash the text together with everything that shapes the output"""
+    material = json.dumps(
+        {"version": CACHE_KEY_VERSION, "text": text, "seed": seed, "settings": settings or {}},
+        sort_keys=True, ensure_ascii=False, default=str,
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class HumanizerCache:
+    """Two-tier result cache: bounded in-memory LRU plus optional SQLite file
+
+    Memory hits are served straight from an OrderedDict. Disk hits are
+    promoted into memory. The SQLite tier evicts its least recently used
+    rows once the stored results exceed ``max_disk_bytes``. All methods are
+    thread-safe.
+    """
+
+    def __init__(self, max_entries=1024, db_path=None, max_disk_bytes=64 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_disk_bytes = max_disk_bytes
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.memory_hits = 0
+        self.disk_hits = 0
+
+        self._db = None
+        self._disk_bytes = 0
+        if db_path:
+            self._db = sqlite3.connect(db_path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "size INTEGER NOT NULL, accessed REAL NOT NULL)"
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed)")
+            self._db.commit()
+            self._disk_bytes = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+
+    def get(self, key):
+        """Return the cached result for ``key``, or None"""
+        with self._lock:
+            value = self._memory.get(key)
+            if value is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                self.memory_hits += 1
+                return value
+
+            if self._db is not None:
+                row = self._db.execute("SELECT value FROM results WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    self._db.execute("UPDATE results SET accessed = ? WHERE key = ?", (time.time(), key))
+                    self._db.commit()
+                    self._remember(key, row[0])
+                    self.hits += 1
+                    self.disk_hits += 1
+                    return row[0]
+
+            self.misses += 1
+            return None
+
+    def put(self, key, value):
+        """Store a result in both tiers"""
+        with self._lock:
+            self._remember(key, value)
+            if self._db is None:
+                return
+
+            size = len(value.encode("utf-8"))
+            previous = self._db.execute("SELECT size FROM results WHERE key = ?", (key,)).fetchone()
+            self._db.execute(
+                "INSERT OR REPLACE INTO results (key, value, size, accessed) VALUES (?, ?, ?, ?)",
+                (key, value, size, time.time()),
+            )
+            self._disk_bytes += size - (previous[0] if previous else 0)
+            if self._disk_bytes > self.max_disk_bytes:
+                self._evict_disk()
+            self._db.commit()
+
+    def _remember(self, key, value):
+        """Insert into the memory tier, dropping the least recently used entry"""
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _evict_disk(self):
+        """Delete the least recently used rows until under the size target"""
+        target = self.max_disk_bytes * _DISK_EVICTION_TARGET
+        rows = self._db.execute("SELECT key, size FROM results ORDER BY accessed")
+        doomed = []
+        for key, size in rows:
+            if self._disk_bytes <= target:
+                break
+            doomed.append((key,))
+            self._disk_bytes -= size
+        self._db.executemany("DELETE FROM results WHERE key = ?", doomed)
+
+    def clear(self):
+        """Drop every cached result and reset the counters"""
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM results")
+                self._db.commit()
+                self._disk_bytes = 0
+            self.hits = self.misses = self.memory_hits = self.disk_hits = 0
+
+    def stats(self):
+        """Return hit/miss counters and tier sizes"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "memory_entries": len(self._memory),
+                "disk_bytes": self._disk_bytes,
+            }
+
+
+class CachedHumanizer:
+    """Wraps an AdvancedHumanizer so repeated requests are served from a cache
+
+    Only reproducible calls are cached: those with a ``seed``, or any call on
+    a deterministic humanizer. Other calls go straight to the engine, since
+    caching them would freeze output that is meant to vary.
+    """
+
+    def __init__(self, humanizer, cache=None):
+        self.humanizer = humanizer
+        self.cache = cache if cache is not None else HumanizerCache()
+
+    def humanize(self, text, seed=None, settings=None, progress=None):
+        """Humanize ``text``, keyed by the text, seed, ``settings`` and lexicon content
+
+        ``settings`` are passed to the engine as keyword arguments. A cache
+        hit reports a single ``("cache", 1.0)`` step to ``progress``.
+        """
+        settings = dict(settings or {})
+        if seed is None and not self.humanizer.deterministic:
+            return self.humanizer.humanize(text, seed=seed, progress=progress, **settings)
+
+        key = cache_key(text, seed, dict(
+            settings, engine=self.humanizer.options, lexicon=self.humanizer.lexicon.source_hash
+        ))
+        result = self.cache.get(key)
+        if result is None:
+            result = self.humanizer.humanize(text, seed=seed, progress=progress, **settings)
+            if isinstance(result, str):
+                self.cache.put(key, result)
+        elif progress is not None:
+            progress("cache", 1.0)
+        return result
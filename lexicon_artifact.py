@@ -0,0 +1,363 @@
+#!/usr/bin/env python3
+"""
+Lexicon Artifact
+Compiles the humanizer's word and phrase tables into one versioned binary
+file that every process maps read-only, so pool workers share its pages
+instead of each building their own dicts and lists
+
+File layout (little endian, all offsets absolute):
+    header      magic, format version, SHA-256 of the source tables, table count
+    directory   one record per table: name, kind, flags, entry count and the
+                offsets of its entries, hash slots and filter bitmap
+    entries     (string offset, length) pairs in source order
+    slots       open-addressing hash index over the lowercased keys (mappings)
+    bitmap      65536-bit filter of key hashes, so most misses cost one probe
+    strings     UTF-8 string table
+"""
+
+import hashlib
+import mmap
+import os
+import re
+import struct
+import sys
+import threading
+import zlib
+from collections.abc import Mapping, Sequence
+
+MAGIC = b'HLEX'
+FORMAT_VERSION = 1
+
+# Table kinds: {key: value} mappings, lists of strings, lists of (a, b) pairs
+KIND_MAPPING = 0
+KIND_LIST = 1
+KIND_PAIRS = 2
+
+# Directory flag: every key of the mapping is a single word
+FLAG_SINGLE_WORDS = 1
+
+_HEADER = struct.Struct('<4sHH32sI')
+_TABLE = struct.Struct('<IIBBxxIIIIII')
+_ENTRY = struct.Struct('<II')
+_SLOT = struct.Struct('<IIII')
+_BITMAP_BYTES = 8192
+
+# Recent lookups remembered per mapping, so repeated words skip the probe
+_MEMO_SIZE = 4096
+_MISSING = object()
+
+# Where compiled artifacts are kept (override with HUMANIZER_ARTIFACT_DIR)
+DEFAULT_ARTIFACT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.lexicon_cache')
+
+_loaded = {}
+_load_lock = threading.Lock()
+
+
+class ArtifactError(ValueError):
+    """Raised when an artifact file is corrupt or was built by another version"""
+
+
+def _kind(table):
+    if isinstance(table, Mapping):
+        return KIND_MAPPING
+    if all(isinstance(item, str) for item in table):
+        return KIND_LIST
+    return KIND_PAIRS
+
+
+def source_hash(tables):
+    """SHA-256 of the tables and the format version; any edit changes it"""
+    material = repr((FORMAT_VERSION, [
+        (name, _kind(table), list(table.items()) if isinstance(table, Mapping) else list(table))
+        for name, table in tables.items()
+    ]))
+    return hashlib.sha256(material.encode('utf-8')).digest()
+
+
+def build_artifact(tables, path):
+    """Compile ``{name: table}`` into an artifact file at ``path``
+
+    The file is written next to its destination and renamed into place, so
+    processes racing to build the same artifact never read a partial file.
+    """
+    strings = bytearray()
+    string_offsets = {}
+
+    # Offsets into the string table are fixed up once the layout is known
+    def intern(value):
+        offset = string_offsets.get(value)
+        if offset is None:
+            encoded = value.encode('utf-8')
+            offset = string_offsets[value] = (len(strings), len(encoded))
+            strings.extend(encoded)
+        return offset
+
+    layouts = []
+    for name, table in tables.items():
+        kind = _kind(table)
+        if kind == KIND_MAPPING:
+            items = list(table.items())
+            entries = [intern(part) for pair in items for part in pair]
+        elif kind == KIND_PAIRS:
+            items = [tuple(pair) for pair in table]
+            entries = [intern(part) for pair in items for part in pair]
+        else:
+            items = list(table)
+            entries = [intern(item) for item in items]
+
+        slots = []
+        slot_count = 0
+        bitmap = b''
+        flags = 0
+        if kind == KIND_MAPPING:
+            slot_count = 8
+            while slot_count < 2 * len(items):
+                slot_count *= 2
+            slots = [None] * slot_count
+            filter_bits = bytearray(_BITMAP_BYTES)
+            seen = set()
+            for index, (key, _) in enumerate(items):
+                lowered = key.lower()
+                if lowered in seen:
+                    # First entry wins, like the case-insensitive matchers
+                    continue
+                seen.add(lowered)
+                encoded = lowered.encode('utf-8')
+                key_hash = zlib.crc32(encoded)
+                filter_bits[(key_hash >> 16) >> 3] |= 1 << ((key_hash >> 16) & 7)
+                position = key_hash & (slot_count - 1)
+                while slots[position] is not None:
+                    position = (position + 1) & (slot_count - 1)
+                slots[position] = (key_hash, index + 1, intern(lowered))
+            bitmap = bytes(filter_bits)
+            if all(re.fullmatch(r'\w+', key) for key, _ in items):
+                flags |= FLAG_SINGLE_WORDS
+        layouts.append((intern(name), kind, flags, len(items), entries, slots, slot_count, bitmap))
+
+    # Lay out header, directory, entries, slots, bitmaps, then strings
+    position = _HEADER.size + _TABLE.size * len(layouts)
+    placed = []
+    for layout in layouts:
+        _, _, _, _, entries, slots, slot_count, bitmap = layout
+        entries_at = position
+        position += _ENTRY.size * len(entries)
+        slots_at = position
+        position += _SLOT.size * slot_count
+        bitmap_at = position
+        position += len(bitmap)
+        placed.append((entries_at, slots_at, bitmap_at))
+    strings_at = position
+
+    out = bytearray(_HEADER.pack(MAGIC, FORMAT_VERSION, 0, source_hash(tables), len(layouts)))
+    for (name, kind, flags, count, _, _, slot_count, bitmap), (entries_at, slots_at, bitmap_at) in zip(layouts, placed):
+        out += _TABLE.pack(strings_at + name[0], name[1], kind, flags, count,
+                           entries_at, slots_at, slot_count, bitmap_at, len(bitmap))
+    for _, _, _, _, entries, slots, slot_count, bitmap in layouts:
+        for offset, length in entries:
+            out += _ENTRY.pack(strings_at + offset, length)
+        for slot in slots:
+            if slot is None:
+                out += _SLOT.pack(0, 0, 0, 0)
+            else:
+                key_hash, entry, (offset, length) = slot
+                out += _SLOT.pack(key_hash, entry, strings_at + offset, length)
+        out += bitmap
+    out += strings
+
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    temporary = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(temporary, 'wb') as stream:
+            stream.write(out)
+        os.chmod(temporary, 0o644)
+        os.replace(temporary, path)
+    except BaseException:
+        if os.path.exists(temporary):
+            os.unlink(temporary)
+        raise
+
+
+class ArtifactMapping(Mapping):
+    """Read-only case-insensitive mapping backed by the artifact's hash index
+
+    Iteration yields the original keys in source order; lookups lowercase
+    the key and probe the mmap'd slots, so no per-process copy of the table
+    is built. Only a small memo of recently looked-up words is kept.
+    """
+
+    def __init__(self, buffer, count, entries_at, slots_at, slot_count, bitmap_at, single_words):
+        self._buffer = buffer
+        self._count = count
+        self._entries_at = entries_at
+        self._slots_at = slots_at
+        self._mask = slot_count - 1
+        self._bitmap_at = bitmap_at
+        self.single_words = single_words
+        self._memo = {}
+
+    def _string(self, entry):
+        offset, length = _ENTRY.unpack_from(self._buffer, self._entries_at + entry * _ENTRY.size)
+        return self._buffer[offset:offset + length].decode('utf-8')
+
+    def get(self, key, default=None):
+        value = self._memo.get(key, _MISSING)
+        if value is _MISSING:
+            value = self._probe(key)
+            if len(self._memo) >= _MEMO_SIZE:
+                self._memo.clear()
+            self._memo[key] = value
+        return default if value is None else value
+
+    def _probe(self, key):
+        """Look ``key`` up in the mmap'd hash index"""
+        encoded = key.lower().encode('utf-8')
+        key_hash = zlib.crc32(encoded)
+        buffer = self._buffer
+        high = key_hash >> 16
+        if not buffer[self._bitmap_at + (high >> 3)] & (1 << (high & 7)):
+            return None
+        position = key_hash & self._mask
+        while True:
+            slot_hash, entry, offset, length = _SLOT.unpack_from(buffer, self._slots_at + position * _SLOT.size)
+            if not entry:
+                return None
+            if slot_hash == key_hash and buffer[offset:offset + length] == encoded:
+                return self._string(2 * (entry - 1) + 1)
+            position = (position + 1) & self._mask
+
+    def __getitem__(self, key):
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key):
+        return isinstance(key, str) and self.get(key) is not None
+
+    def __iter__(self):
+        for index in range(self._count):
+            yield self._string(2 * index)
+
+    def __len__(self):
+        return self._count
+
+    def items(self):
+        return [(self._string(2 * index), self._string(2 * index + 1)) for index in range(self._count)]
+
+
+class ArtifactSequence(Sequence):
+    """Read-only list of strings (or of string pairs) stored in the artifact"""
+
+    def __init__(self, buffer, count, entries_at, pairs):
+        self._buffer = buffer
+        self._count = count
+        self._entries_at = entries_at
+        self._width = 2 if pairs else 1
+
+    def _string(self, entry):
+        offset, length = _ENTRY.unpack_from(self._buffer, self._entries_at + entry * _ENTRY.size)
+        return self._buffer[offset:offset + length].decode('utf-8')
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError('artifact table index out of range')
+        if self._width == 2:
+            return (self._string(2 * index), self._string(2 * index + 1))
+        return self._string(index)
+
+    def __len__(self):
+        return self._count
+
+
+class LexiconArtifact:
+    """A compiled artifact mapped read-only into memory"""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as handle:
+            self._mmap = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, version, _, digest, count = _HEADER.unpack_from(self._mmap, 0)
+        except struct.error:
+            raise ArtifactError(f"{path} is too short to be a lexicon artifact") from None
+        if magic != MAGIC:
+            raise ArtifactError(f"{path} is not a lexicon artifact")
+        if version != FORMAT_VERSION:
+            raise ArtifactError(f"{path} has format version {version}, expected {FORMAT_VERSION}")
+        self.source_hash = digest
+
+        self.tables = {}
+        for index in range(count):
+            (name_at, name_length, kind, flags, entries, entries_at,
+             slots_at, slot_count, bitmap_at, _) = _TABLE.unpack_from(self._mmap, _HEADER.size + index * _TABLE.size)
+            name = self._mmap[name_at:name_at + name_length].decode('utf-8')
+            if kind == KIND_MAPPING:
+                self.tables[name] = ArtifactMapping(
+                    self._mmap, entries, entries_at, slots_at, slot_count, bitmap_at,
+                    bool(flags & FLAG_SINGLE_WORDS),
+                )
+            else:
+                self.tables[name] = ArtifactSequence(self._mmap, entries, entries_at, kind == KIND_PAIRS)
+
+    def __getitem__(self, name):
+        return self.tables[name]
+
+    def close(self):
+        self.tables = {}
+        self._mmap.close()
+
+
+def artifact_path(tables, directory=None):
+    """File name for ``tables``: the content hash is part of the name"""
+    directory = directory or os.environ.get('HUMANIZER_ARTIFACT_DIR') or DEFAULT_ARTIFACT_DIR
+    return os.path.join(directory, f"lexicon-v{FORMAT_VERSION}-{source_hash(tables).hex()[:16]}.bin")
+
+
+def load_artifact(tables, directory=None):
+    """Return the artifact for ``tables``, compiling it if missing or stale
+
+    Loaded artifacts are cached per process by path. A file whose embedded
+    hash or format version does not match is rebuilt.
+    """
+    path = artifact_path(tables, directory)
+    artifact = _loaded.get(path)
+    if artifact is not None:
+        return artifact
+
+    with _load_lock:
+        artifact = _loaded.get(path)
+        if artifact is None:
+            digest = source_hash(tables)
+            try:
+                artifact = LexiconArtifact(path)
+                if artifact.source_hash != digest:
+                    artifact.close()
+                    artifact = None
+            except (OSError, ArtifactError, ValueError):
+                artifact = None
+            if artifact is None:
+                build_artifact(tables, path)
+                artifact = LexiconArtifact(path)
+            _loaded[path] = artifact
+    return artifact
+
+
+def load_tables(tables=None, directory=None):
+    """Return ``{name: read-only table}`` served from the shared artifact
+
+    ``tables`` defaults to lexicon_tables.SOURCE_TABLES. If the artifact
+    cannot be written or mapped, the source tables are returned as they are.
+    """
+    if tables is None:
+        from lexicon_tables import SOURCE_TABLES
+        tables = SOURCE_TABLES
+    try:
+        return dict(load_artifact(tables, directory).tables)
+    except (OSError, ValueError) as e:
+        print(f"Lexicon artifact unavailable, using in-memory tables: {e}", file=sys.stderr)
+        return dict(tables)
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Lexicon Packs
+Extra word and phrase tables loaded from JSON or TSV files and merged over
+the built-in tables of lexicon_tables.py
+
+JSON packs hold any of the built-in table names:
+    {"aggressive_replacements": {"leverage": "use"}, "fillers": ["kinda"]}
+
+TSV packs hold one entry per line: "formal<TAB>casual" adds a word
+replacement and "table<TAB>key<TAB>value" adds to another mapping table.
+Blank lines and lines starting with "#" are skipped.
+"""
+
+import json
+import os
+import re
+
+from lexicon_tables import SOURCE_TABLES
+
+# File types picked up when a directory of packs is given
+PACK_EXTENSIONS = ('.json', '.tsv')
+
+# Tables holding regular expressions, checked when a pack is read
+_PATTERN_TABLES = ('ai_patterns', 'imperfection_rules')
+
+# Group references in a replacement, which rules never expand
+_GROUP_REFERENCE_RE = re.compile(r'\\(?:\d|g<)')
+
+
+def expand_packs(paths):
+    """Expand pack files and directories into a list of pack files"""
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(
+                os.path.join(path, name) for name in sorted(os.listdir(path))
+                if name.endswith(PACK_EXTENSIONS)
+            )
+        else:
+            files.append(path)
+    return files
+
+
+def _read_tsv(path):
+    tables = {}
+    with open(path, encoding='utf-8') as handle:
+        for line_number, line in enumerate(handle, 1):
+            line = line.rstrip('\r\n')
+            if not line.strip() or line.lstrip().startswith('#'):
+                continue
+            fields = line.split('\t')
+            if len(fields) == 2:
+                fields.insert(0, 'aggressive_replacements')
+            if len(fields) != 3 or not all(field.strip() for field in fields):
+                raise ValueError(f"{path}:{line_number}: expected 'formal<TAB>casual' or 'table<TAB>key<TAB>value'")
+            name, key, value = (field.strip() for field in fields)
+            if not isinstance(SOURCE_TABLES.get(name), dict):
+                raise ValueError(f"{path}:{line_number}: {name!r} is not a mapping table")
+            tables.setdefault(name, {})[key] = value
+    return tables
+
+
+def _read_json(path):
+    with open(path, encoding='utf-8') as handle:
+        try:
+            tables = json.load(handle)
+        except ValueError as e:
+            raise ValueError(f"{path}: invalid JSON: {e}") from None
+    if not isinstance(tables, dict):
+        raise ValueError(f"{path}: expected a JSON object of tables")
+
+    for name, table in tables.items():
+        base = SOURCE_TABLES.get(name)
+        if base is None:
+            raise ValueError(f"{path}: unknown table {name!r}, expected one of {tuple(SOURCE_TABLES)}")
+        if isinstance(base, dict):
+            if not isinstance(table, dict) or not all(
+                isinstance(key, str) and isinstance(value, str) for key, value in table.items()
+            ):
+                raise ValueError(f"{path}: {name!r} must map strings to strings")
+        elif name == 'imperfection_rules':
+            if not isinstance(table, list) or not all(
+                isinstance(rule, list) and len(rule) == 2 and all(isinstance(part, str) for part in rule)
+                for rule in table
+            ):
+                raise ValueError(f"{path}: {name!r} must be a list of [pattern, replacement] pairs")
+            tables[name] = [tuple(rule) for rule in table]
+        elif not isinstance(table, list) or not all(isinstance(item, str) for item in table):
+            raise ValueError(f"{path}: {name!r} must be a list of strings")
+    return tables
+
+
+def read_pack(path):
+    """Read one pack file into ``{table name: entries}``"""
+    if path.endswith('.tsv'):
+        tables = _read_tsv(path)
+    else:
+        tables = _read_json(path)
+
+    # Rules are fused into one alternation at runtime, so each pattern must
+    # be valid on its own, work as a group of it and must not capture or
+    # refer to groups
+    for name in _PATTERN_TABLES:
+        for entry in tables.get(name, ()):
+            pattern = entry[0] if isinstance(entry, tuple) else entry
+            try:
+                compiled = re.compile(pattern)
+                re.compile(f'(?:{pattern})')
+            except re.error as e:
+                raise ValueError(f"{path}: invalid pattern {pattern!r} in {name!r}: {e}") from None
+            if compiled.groups:
+                raise ValueError(f"{path}: pattern {pattern!r} in {name!r} has capture groups, use (?:...) instead")
+            if isinstance(entry, tuple) and _GROUP_REFERENCE_RE.search(entry[1]):
+                raise ValueError(f"{path}: replacement {entry[1]!r} in {name!r} refers to a group")
+    return tables
+
+
+def merge_tables(base, packs):
+    """Layer pack tables over ``base``, later packs winning
+
+    Mapping entries replace base entries whose key matches ignoring case;
+    list entries are appended unless already present.
+    """
+    merged = {name: (dict(table) if isinstance(table, dict) else list(table)) for name, table in base.items()}
+    for pack in packs:
+        for name, table in pack.items():
+            if isinstance(table, dict):
+                overridden = {key.lower() for key in table}
+                current = {key: value for key, value in merged[name].items() if key.lower() not in overridden}
+                current.update(table)
+                merged[name] = current
+            else:
+                merged[name].extend(item for item in table if item not in merged[name])
+    return merged
+
+
+def load_pack_tables(paths=()):
+    """Return the built-in tables merged with every pack in ``paths``"""
+    files = expand_packs(paths)
+    if not files:
+        return SOURCE_TABLES
+    return merge_tables(SOURCE_TABLES, [read_pack(path) for path in files])
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Lexicon Tables
+Source word and phrase tables of the humanizer; compiled into the shared
+lexicon artifact by lexicon_artifact.py
+"""
+
+# Aggressive word replacements - AI to Human
+AGGRESSIVE_REPLACEMENTS = {
+    # Formal academic words → Casual equivalents
+    "utilize": "use", "utilization": "use", "utilized": "used",
+    "implement": "do", "implementation": "doing", "implemented": "did",
+    "facilitate": "help", "facilitating": "helping", "facilitated": "helped",
+    "demonstrate": "show", "demonstrates": "shows", "demonstrated": "showed",
+    "indicate": "show", "indicates": "shows", "indicated": "showed",
+    "significant": "big", "significantly": "really", 
+    "substantial": "large", "substantially": "really",
+    "numerous": "many", "various": "different", "multiple": "many",
+    "however": "but", "nevertheless": "but", "furthermore": "also",
+    "therefore": "so", "consequently": "so", "subsequently": "then",
+    "moreover": "also", "additionally": "also", "alternatively": "or",
+    "approximately": "about", "approximately": "around",
+    "methodology": "method", "methodologies": "methods",
+    "optimization": "improvement", "optimizations": "improvements",
+    "enhancement": "improvement", "enhancements": "improvements",
+    "acquisition": "getting", "acquire": "get", "acquired": "got",
+    "comprehension": "understanding", "comprehend": "understand",
+    "determination": "finding out", "determine": "find out",
+    "examination": "looking at", "examine": "look at",
+    "investigation": "checking", "investigate": "check",
+    "establishment": "setting up", "establish": "set up",
+    "consideration": "thinking about", "consider": "think about",
+    "evaluation": "checking", "evaluate": "check",
+    "analysis": "breakdown", "analyze": "break down",
+    "synthesis": "putting together", "synthesize": "put together",
+    "verification": "checking", "verify": "check",
+    "modification": "change", "modify": "change", "modified": "changed",
+    "generation": "making", "generate": "make", "generated": "made",
+    "creation": "making", "create": "make", "created": "made",
+    "construction": "building", "construct": "build", "constructed": "built",
+    "development": "building", "develop": "build", "developed": "built",
+    "production": "making", "produce": "make", "produced": "made",
+    "administration": "running", "administer": "run", "administered": "ran",
+    "coordination": "organizing", "coordinate": "organize", "coordinated": "organized",
+    "collaboration": "working together", "collaborate": "work together",
+    "communication": "talking", "communicate": "talk", "communicated": "talked",
+    "documentation": "writing down", "document": "write down", "documented": "wrote down",
+    "specification": "details", "specify": "detail", "specified": "detailed",
+    "requirement": "need", "requirements": "needs", "required": "needed",
+    "recommendation": "suggestion", "recommend": "suggest", "recommended": "suggested",
+    "conclusion": "ending", "conclude": "end", "concluded": "ended",
+    "decision": "choice", "decide": "choose", "decided": "chose",
+    "selection": "picking", "select": "pick", "selected": "picked",
+    "identification": "finding", "identify": "find", "identified": "found",
+    "recognition": "spotting", "recognize": "spot", "recognized": "spotted",
+    "observation": "seeing", "observe": "see", "observed": "saw",
+    "notification": "telling", "notify": "tell", "notified": "told",
+    "information": "info", "informational": "info-based",
+    "operational": "working", "operations": "work", "operate": "work",
+    "functional": "working", "function": "work", "functions": "works",
+    "professional": "work-related", "professionalism": "being professional",
+    "traditional": "old", "traditionally": "usually",
+    "conventional": "normal", "conventionally": "normally",
+    "fundamental": "basic", "fundamentally": "basically",
+    "essential": "key", "essentially": "basically",
+    "critical": "important", "critically": "importantly",
+    "optimal": "best", "optimally": "best way",
+    "maximum": "most", "maximize": "boost", "maximized": "boosted",
+    "minimum": "least", "minimize": "reduce", "minimized": "reduced",
+    "superior": "better", "superiority": "being better",
+    "inferior": "worse", "inferiority": "being worse",
+    "advanced": "newer", "advancement": "improvement",
+    "sophisticated": "complex", "sophistication": "complexity",
+    "comprehensive": "complete", "comprehensively": "completely",
+    "extensive": "wide", "extensively": "widely",
+    "intensive": "heavy", "intensively": "heavily",
+    "effective": "good", "effectiveness": "how good",
+    "efficient": "fast", "efficiency": "speed",
+    "accurate": "right", "accuracy": "being right",
+    "precise": "exact", "precision": "being exact",
+    "reliable": "dependable", "reliability": "dependability",
+    "consistent": "steady", "consistency": "steadiness",
+    "persistent": "lasting", "persistence": "lasting",
+    "continuous": "ongoing", "continuously": "ongoing",
+    "simultaneous": "at the same time", "simultaneously": "at the same time",
+    "immediate": "instant", "immediately": "right away",
+    "subsequent": "next", "subsequently": "then",
+    "previous": "earlier", "previously": "before",
+    "initial": "first", "initially": "at first",
+    "final": "last", "finally": "in the end",
+    "ultimate": "final", "ultimately": "in the end",
+    "primary": "main", "primarily": "mainly",
+    "secondary": "second", "secondarily": "secondly",
+    "tertiary": "third",
+    "alternative": "other", "alternatively": "or",
+    "additional": "extra", "additionally": "also",
+    "supplementary": "extra", "supplement": "add to",
+    "complementary": "matching", "complement": "match",
+    "proportional": "matching", "proportion": "part",
+    "equivalent": "equal", "equivalence": "equality",
+    "identical": "same", "identity": "sameness",
+    "similar": "alike", "similarity": "likeness",
+    "different": "unlike", "difference": "gap",
+    "distinct": "separate", "distinction": "separation",
+    "unique": "one-of-a-kind", "uniqueness": "being one-of-a-kind",
+    "specific": "exact", "specifically": "exactly",
+    "general": "broad", "generally": "broadly",
+    "particular": "specific", "particularly": "especially",
+    "individual": "single", "individually": "one by one",
+    "collective": "group", "collectively": "as a group",
+    "universal": "worldwide", "universally": "worldwide",
+    "global": "worldwide", "globally": "worldwide",
+    "local": "nearby", "locally": "nearby",
+    "regional": "area-based", "regionally": "by area",
+    "national": "country-wide", "nationally": "country-wide",
+    "international": "between countries", "internationally": "between countries"
+}
+
+# Sentence starters that sound human
+HUMAN_STARTERS = [
+    "Well, ", "Actually, ", "You know, ", "Honestly, ", "Look, ",
+    "Listen, ", "So, ", "Anyway, ", "I mean, ", "To be fair, ",
+    "Let's be real, ", "Here's the thing - ", "The way I see it, ",
+    "From what I can tell, ", "As far as I know, ", "It seems like ",
+    "Basically, ", "Pretty much, ", "More or less, ", "Kind of ",
+    "Sort of ", "I guess ", "Maybe ", "Probably ", "Likely ",
+    "It's like ", "Think about it - ", "Consider this: ",
+    "Get this - ", "Check it out - ", "Here's what happens: "
+]
+
+# Conversational connectors
+CONNECTORS = [
+    "and then", "so then", "after that", "next thing", "plus",
+    "on top of that", "what's more", "not to mention", "besides",
+    "by the way", "speaking of which", "while we're at it",
+    "come to think of it", "now that I think about it"
+]
+
+# Filler words and expressions
+FILLERS = [
+    "you know", "like", "I mean", "sort of", "kind of", "pretty much",
+    "more or less", "or something", "or whatever", "and stuff",
+    "and things like that", "and all that", "you get the idea",
+    "if you know what I mean", "right?", "you see"
+]
+
+# Contractions for natural speech
+CONTRACTIONS = {
+    "do not": "don't", "does not": "doesn't", "did not": "didn't",
+    "will not": "won't", "would not": "wouldn't", "could not": "couldn't",
+    "should not": "shouldn't", "cannot": "can't", "must not": "mustn't",
+    "have not": "haven't", "has not": "hasn't", "had not": "hadn't",
+    "is not": "isn't", "are not": "aren't", "was not": "wasn't",
+    "were not": "weren't", "it is": "it's", "that is": "that's",
+    "there is": "there's", "here is": "here's", "what is": "what's",
+    "where is": "where's", "when is": "when's", "how is": "how's",
+    "who is": "who's", "I am": "I'm", "you are": "you're",
+    "we are": "we're", "they are": "they're", "I will": "I'll",
+    "you will": "you'll", "we will": "we'll", "they will": "they'll",
+    "I would": "I'd", "you would": "you'd", "we would": "we'd",
+    "they would": "they'd", "I have": "I've", "you have": "you've",
+    "we have": "we've", "they have": "they've"
+}
+
+# AI-specific phrase patterns to break
+AI_PATTERNS = [
+    r'\bin conclusion\b', r'\bin summary\b', r'\bto summarize\b',
+    r'\bin essence\b', r'\bfurthermore\b', r'\bmoreover\b',
+    r'\badditionally\b', r'\bnevertheless\b', r'\bhowever\b',
+    r'\bconsequently\b', r'\btherefore\b', r'\bthus\b',
+    r'\bhence\b', r'\baccordingly\b', r'\bsubsequently\b'
+]
+
+# Less formal grammar, each rule applied with a 30% chance per call
+IMPERFECTION_RULES = [
+    (r'\bwho are\b', 'that are'),
+    (r'\bwhich are\b', 'that are'),
+    (r'\bamong\b', 'between'),
+    (r'\bregarding\b', 'about'),
+    (r'\bconcerning\b', 'about'),
+    (r'\bprior to\b', 'before'),
+    (r'\bsubsequent to\b', 'after'),
+    (r'\bin order to\b', 'to'),
+    (r'\bdue to the fact that\b', 'because'),
+    (r'\bfor the reason that\b', 'because'),
+    (r'\bin spite of the fact that\b', 'even though'),
+    (r'\bnotwithstanding the fact that\b', 'even though')
+]
+
+# Every table by the AdvancedHumanizer attribute name it is exposed as
+SOURCE_TABLES = {
+    'aggressive_replacements': AGGRESSIVE_REPLACEMENTS,
+    'human_starters': HUMAN_STARTERS,
+    'connectors': CONNECTORS,
+    'fillers': FILLERS,
+    'contractions': CONTRACTIONS,
+    'ai_patterns': AI_PATTERNS,
+    'imperfection_rules': IMPERFECTION_RULES,
+}
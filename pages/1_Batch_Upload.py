@@ -0,0 +1,260 @@
+import streamlit as st
+import sys
+import os
+import io
+import csv
+import zipfile
+import multiprocessing
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+
+st.set_page_config(
+    page_title="Batch Upload - AI Text Humanizer Pro",
+    page_icon="📦",
+    layout="wide"
+)
+
+# Modules live one level up, next to the main app
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from advanced_humanizer import LANGUAGE_STYLES, MODES, TONES, NLTKDataError, ensure_nltk_data
+from batch_humanizer import humanize_chunk, init_worker
+
+# File types accepted by the uploader
+BATCH_FILE_TYPES = ["txt", "md"]
+
+# Columns of the summary CSV shipped next to the humanized files
+SUMMARY_FIELDS = ["file", "status", "input_words", "output_words", "error"]
+
+# Resolve NLTK data once per process before workers start loading it
+@st.cache_resource
+def prepare_nltk_data():
+    """Locate or download the sentence tokenizer data"""
+    return ensure_nltk_data()
+
+try:
+    prepare_nltk_data()
+except NLTKDataError as e:
+    st.error(f"⚠️ {e}")
+    st.stop()
+
+
+# Worker pools outlive a single batch, so each click skips process startup
+@st.cache_resource
+def get_batch_pool(workers):
+    """Shared worker pool for the given worker count"""
+    # Spawned workers do not inherit the threads of the Streamlit server
+    context = multiprocessing.get_context("spawn")
+    return ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                               initializer=init_worker, initargs=({},))
+
+
+def output_names(uploaded_files):
+    """Archive names for the uploads, numbering repeated file names"""
+    names = []
+    seen = {}
+    for uploaded in uploaded_files:
+        stem, extension = os.path.splitext(uploaded.name)
+        count = seen.get(uploaded.name, 0) + 1
+        seen[uploaded.name] = count
+        name = uploaded.name if count == 1 else f"{stem} ({count}){extension}"
+        names.append(f"humanized/{name}")
+    return names
+
+
+def summary_csv(rows):
+    """Summary rows as CSV text"""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=SUMMARY_FIELDS)
+    writer.writeheader()
+    writer.writerows(rows)
+    return buffer.getvalue()
+
+
+# Batch settings, matching the main page's controls
+with st.sidebar:
+    st.markdown("## 📦 Batch Settings")
+
+    transformation_mode = st.selectbox(
+        "⚡ Processing Mode",
+        MODES,
+        index=1
+    )
+    intensity = st.slider(
+        "🔥 Transformation Intensity",
+        min_value=1,
+        max_value=10,
+        value=7,
+        help="Higher values = more aggressive humanization"
+    )
+    language_mode = st.selectbox(
+        "🌐 Language Style",
+        LANGUAGE_STYLES
+    )
+    output_tone = st.selectbox(
+        "🎭 Writing Tone",
+        TONES
+    )
+    engine_settings = {
+        "mode": transformation_mode,
+        "intensity": intensity,
+        "language": language_mode,
+        "tone": output_tone
+    }
+
+    st.markdown("### ⚙️ Processing")
+    cpu_count = os.cpu_count() or 1
+    workers = st.slider(
+        "🧵 Worker Processes",
+        min_value=1,
+        max_value=cpu_count,
+        value=cpu_count,
+        help="Files are humanized in parallel, one per worker"
+    ) if cpu_count > 1 else 1
+    seed = st.number_input(
+        "🎲 Seed",
+        min_value=0,
+        value=0,
+        step=1,
+        help="The same files, settings and seed always give the same output"
+    )
+
+st.markdown("# 📦 Batch Upload")
+st.markdown("Humanize a whole folder of documents at once and download the results as a zip.")
+
+uploaded_files = st.file_uploader(
+    "Upload .txt or .md files",
+    type=BATCH_FILE_TYPES,
+    accept_multiple_files=True
+)
+
+if uploaded_files:
+    total_bytes = sum(uploaded.size for uploaded in uploaded_files)
+    st.caption(f"📄 {len(uploaded_files)} files, {total_bytes / 1024:.1f} KB")
+
+if st.button("🚀 Humanize Files", type="primary", disabled=not uploaded_files, use_container_width=True):
+    names = output_names(uploaded_files)
+
+    # Step 1: Decode the uploads; undecodable files are reported, not processed
+    texts = []
+    failed = {}
+    for index, uploaded in enumerate(uploaded_files):
+        try:
+            texts.append(uploaded.getvalue().decode("utf-8-sig"))
+        except UnicodeDecodeError as e:
+            failed[index] = e
+            texts.append("")
+
+    # Step 2: One live status line per file
+    progress_bar = st.progress(0)
+    status_lines = [st.empty() for _ in uploaded_files]
+    for index, uploaded in enumerate(uploaded_files):
+        status_lines[index].markdown(f"⏳ {uploaded.name}: queued")
+
+    # Step 3: Keep one file per worker running and mark each file as it finishes
+    rows = [None] * len(texts)
+    outputs = {}
+
+    def finish(index, result):
+        uploaded = uploaded_files[index]
+        input_words = len(texts[index].split())
+        if isinstance(result, Exception):
+            rows[index] = {"file": uploaded.name, "status": "error", "input_words": input_words,
+                           "output_words": 0, "error": str(result)}
+            status_lines[index].markdown(f"❌ {uploaded.name}: {result}")
+        else:
+            outputs[index] = result
+            rows[index] = {"file": uploaded.name, "status": "ok", "input_words": input_words,
+                           "output_words": len(result.split()), "error": ""}
+            status_lines[index].markdown(f"✅ {uploaded.name}: {rows[index]['output_words']} words")
+
+    for index, error in failed.items():
+        finish(index, error)
+
+    archive_buffer = io.BytesIO()
+    started = datetime.now()
+    pool = get_batch_pool(workers)
+    with zipfile.ZipFile(archive_buffer, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        waiting = deque(index for index in range(len(texts)) if index not in failed)
+        running = {}
+        written = 0
+        done = len(failed)
+
+        def start_next():
+            index = waiting.popleft()
+            future = pool.submit(humanize_chunk, [texts[index]], True, int(seed), engine_settings)
+            running[future] = index
+            status_lines[index].markdown(f"⚙️ {uploaded_files[index].name}: humanizing...")
+
+        while waiting and len(running) < workers:
+            start_next()
+
+        while running:
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                index = running.pop(future)
+                try:
+                    finish(index, future.result()[0])
+                except BrokenProcessPool as e:
+                    # A crashed worker breaks the pool; the next batch builds a new one
+                    get_batch_pool.clear()
+                    finish(index, e)
+                except Exception as e:
+                    finish(index, e)
+                done += 1
+                if waiting:
+                    start_next()
+
+            # Zip entries follow upload order, written once every earlier file is done
+            while written < len(rows) and rows[written] is not None:
+                if written in outputs:
+                    archive.writestr(names[written], outputs.pop(written))
+                written += 1
+            progress_bar.progress(done / len(texts))
+
+        while written < len(rows):
+            if written in outputs:
+                archive.writestr(names[written], outputs.pop(written))
+            written += 1
+        progress_bar.progress(1.0)
+        archive.writestr("summary.csv", summary_csv(rows))
+
+    st.session_state.batch_zip = archive_buffer.getvalue()
+    st.session_state.batch_summary = rows
+    st.session_state.batch_seconds = (datetime.now() - started).total_seconds()
+
+# Results of the last batch stay downloadable across reruns
+if st.session_state.get("batch_summary"):
+    rows = st.session_state.batch_summary
+    errors = sum(1 for row in rows if row["status"] == "error")
+    st.markdown("---")
+    st.markdown("### 📊 Batch Summary")
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Files", len(rows))
+    with col2:
+        st.metric("Errors", errors)
+    with col3:
+        st.metric("Time", f"{st.session_state.batch_seconds:.1f}s")
+    st.dataframe(rows, hide_index=True, use_container_width=True)
+
+    col1, col2 = st.columns(2)
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    with col1:
+        st.download_button(
+            "💾 Download ZIP",
+            data=st.session_state.batch_zip,
+            file_name=f"humanized_{timestamp}.zip",
+            mime="application/zip",
+            use_container_width=True
+        )
+    with col2:
+        st.download_button(
+            "📄 Download Summary CSV",
+            data=summary_csv(rows),
+            file_name=f"humanized_summary_{timestamp}.csv",
+            mime="text/csv",
+            use_container_width=True
+        )
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Built-in Sentence Segmenter
+Regex and abbreviation-table based alternative to NLTK punkt
+"""
+
+import re
+
+# Abbreviations that do not end a sentence even before a capitalized word
+ABBREVIATIONS = {
+    "mr", "mrs", "ms", "dr", "prof", "sr", "jr", "st", "mt", "rev", "hon",
+    "gen", "col", "capt", "lt", "sgt", "gov", "sen", "rep", "pres",
+    "e.g", "i.e", "vs", "cf", "viz", "al", "approx", "fig", "figs", "eq",
+    "no", "nos", "vol", "pp", "ch", "sec", "dept", "est", "jan", "feb",
+    "mar", "apr", "aug", "sept", "oct", "nov", "dec"
+}
+
+# Sentence-final punctuation plus closing quotes/brackets, shared with the engine
+SENTENCE_END_PATTERN = r'[.!?…]+["\'”’)\]]*'
+
+# A sentence end or a blank line
+_CANDIDATE_RE = re.compile(
+    r'(' + SENTENCE_END_PATTERN + r')(?=\s|$)|\n[ \t]*\n'
+)
+
+# Longest token inspected before a period when looking for an abbreviation
+_MAX_TOKEN = 16
+
+
+def _token_before(text, end, start):
+    """Return the whitespace-delimited token ending at ``end``"""
+    i = end
+    limit = max(start, end - _MAX_TOKEN)
+    while i > limit and not text[i - 1].isspace():
+        i -= 1
+    return text[i:end].lstrip('"\'(“‘[').lower()
+
+
+def _is_boundary(text, match, start):
+    """Decide whether a candidate punctuation match ends the sentence"""
+    punctuation = match.group(1)
+    if punctuation is None:
+        # Blank line between paragraphs
+        return True
+
+    following = match.end()
+    while following < len(text) and text[following].isspace():
+        following += 1
+    if following == len(text):
+        return True
+
+    next_char = text[following]
+    if not punctuation.rstrip('"\'”’)]').endswith('.'):
+        # "!" and "?" always end a sentence
+        return True
+    if next_char.islower() or next_char.isdigit() or next_char in ',;:':
+        return False
+
+    if punctuation.startswith('.') and not punctuation.startswith('..'):
+        token = _token_before(text, match.start(), start)
+        if token in ABBREVIATIONS:
+            return False
+        if len(token) == 1 and token.isalpha():
+            # Initials such as "J. Smith"
+            return False
+
+    return True
+
+
+def segment_sentences(text):
+    """Split text into sentences, keeping their terminal punctuation
+
+    Runs in a single left-to-right pass over the candidate boundaries, so
+    the cost is linear in the length of the text.
+    """
+    sentences = []
+    start = 0
+
+    for match in _CANDIDATE_RE.finditer(text):
+        if match.end() <= start or not _is_boundary(text, match, start):
+            continue
+        end = match.end(1) if match.group(1) is not None else match.start()
+        sentence = text[start:end].strip()
+        if sentence:
+            sentences.append(sentence)
+        start = match.end()
+
+    sentence = text[start:].strip()
+    if sentence:
+        sentences.append(sentence)
+
+    return sentences
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Session History
+Fixed-capacity store of compact processing records for the Streamlit app
+"""
+
+from collections import deque, namedtuple
+
+HistoryRecord = namedtuple("HistoryRecord", [
+    "number", "timestamp", "input_preview", "output_preview", "input_words",
+    "output_words", "detection", "mode", "intensity", "language_mode", "tone",
+    "input_text", "output_text",
+])
+HistoryRecord.__doc__ = "One processed text; full texts are None unless kept on request"
+
+
+class SessionHistory:
+    """Ring buffer of the most recent records plus running aggregates
+
+    Only the last ``capacity`` records are kept, each holding short previews
+    of the input and output. Totals and the average detection score cover
+    every record ever added and are maintained incrementally, so the sidebar
+    statistics cost O(1) however long the session runs.
+    """
+
+    def __init__(self, capacity=50, preview_chars=100, keep_full_text=False):
+        self.preview_chars = preview_chars
+        self.keep_full_text = keep_full_text
+        self._records = deque(maxlen=capacity)
+        self.total = 0
+        self._detection_sum = 0
+
+    def _preview(self, text):
+        if len(text) <= self.preview_chars:
+            return text
+        return text[:self.preview_chars] + "..."
+
+    def add(self, timestamp, input_text, output_text, detection, mode, intensity,
+            language_mode, tone, keep_full_text=None):
+        """Record a processed text, evicting the oldest record when full"""
+        if keep_full_text is None:
+            keep_full_text = self.keep_full_text
+        self.total += 1
+        self._detection_sum += detection
+        record = HistoryRecord(
+            number=self.total,
+            timestamp=timestamp,
+            input_preview=self._preview(input_text),
+            output_preview=self._preview(output_text),
+            input_words=len(input_text.split()),
+            output_words=len(output_text.split()),
+            detection=detection,
+            mode=mode,
+            intensity=intensity,
+            language_mode=language_mode,
+            tone=tone,
+            input_text=input_text if keep_full_text else None,
+            output_text=output_text if keep_full_text else None,
+        )
+        self._records.append(record)
+        return record
+
+    @property
+    def average_detection(self):
+        """Average detection score over every record added this session"""
+        return self._detection_sum / self.total if self.total else 0.0
+
+    def recent(self, count):
+        """Return up to ``count`` of the newest records, oldest first"""
+        start = max(len(self._records) - count, 0)
+        return [self._records[i] for i in range(start, len(self._records))]
+
+    def clear(self):
+        self._records.clear()
+        self.total = 0
+        self._detection_sum = 0
+
+    def __len__(self):
+        return len(self._records)
+
+    def __bool__(self):
+        return bool(self._records)
@@ -1,13 +1,9 @@
 import streamlit as st
 import sys
 import os
-import time
 import random
 import json
-import plotly.graph_objects as go
-import plotly.express as px
 from datetime import datetime
-import nltk
 
 st.set_page_config(
     page_title=" AI Text Humanizer Pro",
@@ -16,97 +12,114 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Download required NLTK data (for deployment)
-@st.cache_data
-def download_nltk_data():
-    """Download and verify NLTK data availability"""
-    import nltk
-    required_downloads = [
-        ('tokenizers/punkt', 'punkt'),
-        ('tokenizers/punkt_tab', 'punkt_tab'),  # New punkt tokenizer  
-        ('corpora/wordnet', 'wordnet'), 
-        ('corpora/omw-1.4', 'omw-1.4')
-    ]
-    
-    for data_path, download_name in required_downloads:
-        try:
-            nltk.data.find(data_path)
-        except LookupError:
-            try:
-                st.info(f"Downloading {download_name} data...")
-                nltk.download(download_name, quiet=True)
-            except Exception as e:
-                st.warning(f"Could not download {download_name}: {e}")
-                # Try alternative for punkt_tab
-                if download_name == 'punkt_tab':
-                    try:
-                        nltk.download('punkt', quiet=True)
-                    except:
-                        pass
-    
-    return True
-
-# Initialize NLTK data first
-nltk_ready = download_nltk_data()
-
 # Add current directory to path
 sys.path.append(os.getcwd())
 
-from advanced_humanizer import AdvancedHumanizer
+from advanced_humanizer import LANGUAGE_STYLES, MODES, TONES, NLTKDataError, ensure_nltk_data, get_shared_humanizer
+from humanizer_cache import CachedHumanizer, HumanizerCache
+from session_history import SessionHistory
+from example_texts import DEFAULT_EXAMPLE, EXAMPLE_TEMPLATES, SAMPLE_SENTENCES
+from incremental_humanizer import IncrementalHumanizer
+
+# Resolve NLTK data once per process (set HUMANIZER_OFFLINE=1 to skip downloads)
+@st.cache_resource
+def prepare_nltk_data():
+    """Locate or download the sentence tokenizer data"""
+    return ensure_nltk_data()
+
+try:
+    nltk_ready = prepare_nltk_data()
+except NLTKDataError as e:
+    st.error(f"⚠️ {e}")
+    st.stop()
+
+# Results shared by every session (set HUMANIZER_CACHE_DB to persist them)
+@st.cache_resource
+def get_result_cache():
+    """Process-wide cache of humanized results"""
+    return HumanizerCache(max_entries=512, db_path=os.environ.get("HUMANIZER_CACHE_DB"))
+
+# One engine for every session and script thread; per-call state lives in the call
+@st.cache_resource
+def get_humanizer():
+    """Process-wide humanizer backed by the shared result cache"""
+    return CachedHumanizer(get_shared_humanizer(), get_result_cache())
+
+try:
+    humanizer = get_humanizer()
+except Exception as e:
+    st.error(f"Error initializing humanizer: {e}")
+    st.stop()
+
+# Shared look of the analytics charts
+CHART_LAYOUT = {
+    "height": 300,
+    "paper_bgcolor": "rgba(0,0,0,0)",
+    "plot_bgcolor": "rgba(0,0,0,0)",
+    "font": {'color': "#333", 'family': "Inter"},
+}
+
+# Chart specs keyed by their inputs; plotly is only imported when analytics are first shown
+@st.cache_data(max_entries=256)
+def detection_gauge(value, title, bar_color, threshold_color, threshold):
+    """Figure dict of an AI detection gauge"""
+    import plotly.graph_objects as go
+
+    fig = go.Figure()
+    fig.add_trace(go.Indicator(
+        mode = "gauge+number",
+        value = value,
+        domain = {'x': [0, 1], 'y': [0, 1]},
+        title = {'text': title, 'font': {'size': 16}},
+        gauge = {
+            'axis': {'range': [None, 100]},
+            'bar': {'color': bar_color},
+            'steps': [
+                {'range': [0, 20], 'color': "#4CAF50"},
+                {'range': [20, 50], 'color': "#FFC107"},
+                {'range': [50, 100], 'color': "#F44336"}],
+            'threshold': {
+                'line': {'color': threshold_color, 'width': 4},
+                'thickness': 0.75,
+                'value': threshold}}))
+    fig.update_layout(**CHART_LAYOUT)
+    return fig.to_dict()
+
+@st.cache_data(max_entries=64)
+def detection_trend(labels, scores):
+    """Figure dict of the detection score trend over recent entries"""
+    import plotly.express as px
+
+    fig = px.line(x=list(labels), y=list(scores),
+                  title="AI Detection Score Over Time",
+                  labels={'x': 'Processing Session', 'y': 'Detection Score (%)'})
+    fig.update_traces(line_color='#667eea', line_width=3)
+    fig.update_layout(**CHART_LAYOUT)
+    return fig.to_dict()
 
 # Initialize session state with advanced features
 if 'result' not in st.session_state:
     st.session_state.result = ""
 if 'copy_success' not in st.session_state:
     st.session_state.copy_success = False
-if 'humanizer' not in st.session_state:
-    try:
-        st.session_state.humanizer = AdvancedHumanizer()
-    except Exception as e:
-        st.error(f"Error initializing humanizer: {e}")
-        st.stop()
 if 'processing' not in st.session_state:
     st.session_state.processing = False
 if 'history' not in st.session_state:
-    st.session_state.history = []
+    # Bounded store of compact records; old entries drop off the far end
+    st.session_state.history = SessionHistory(capacity=50)
 if 'ai_detection_score' not in st.session_state:
     st.session_state.ai_detection_score = 0
 if 'transformation_mode' not in st.session_state:
     st.session_state.transformation_mode = "Advanced"
 if 'real_time_enabled' not in st.session_state:
     st.session_state.real_time_enabled = False
-
-# Verify NLTK is working
-@st.cache_data  
-def verify_nltk_functionality():
-    """Test that NLTK functions work properly"""
-    try:
-        import nltk
-        # Test sentence tokenization with fallback
-        test_text = "This is a test sentence. This is another sentence."
-        
-        # Try different tokenization methods
-        try:
-            sentences = nltk.sent_tokenize(test_text)
-        except LookupError:
-            # If punkt_tab fails, try downloading all punkt-related data
-            try:
-                nltk.download('punkt', quiet=True)
-                nltk.download('punkt_tab', quiet=True)
-                sentences = nltk.sent_tokenize(test_text)
-            except:
-                # Last resort: simple split
-                sentences = test_text.split('. ')
-        
-        return len(sentences) >= 2
-    except Exception as e:
-        st.error(f"NLTK verification failed: {e}")
-        return False
-
-# Run verification
-if not verify_nltk_functionality():
-    st.error("⚠️ NLTK initialization failed. Please refresh the page.")
-    st.stop()
+if 'live_humanizer' not in st.session_state:
+    # Per-session paragraph cache for real-time mode
+    st.session_state.live_humanizer = IncrementalHumanizer(humanizer.humanizer)
+    st.session_state.live_key = None
+if 'variant' not in st.session_state:
+    # Seed for the current output; Re-process moves to the next variant
+    st.session_state.variant = 0
 
 # Clean and attractive CSS
 st.markdown("""
@@ -425,7 +438,7 @@ with st.sidebar:
     # Transformation mode
     transformation_mode = st.selectbox(
         "⚡ Processing Mode",
-        ["Standard", "Advanced", "Professional", "Creative"],
+        MODES,
         index=1
     )
     st.session_state.transformation_mode = transformation_mode
@@ -448,14 +461,22 @@ with st.sidebar:
     
     language_mode = st.selectbox(
         "🌐 Language Style",
-        ["Casual", "Professional", "Academic", "Creative", "Conversational"]
+        LANGUAGE_STYLES
     )
     
     output_tone = st.selectbox(
         "🎭 Writing Tone",
-        ["Friendly", "Formal", "Witty", "Serious", "Enthusiastic"]
+        TONES
     )
     
+    # Settings passed to the engine, which compiles them into a cached plan
+    engine_settings = {
+        "mode": transformation_mode,
+        "intensity": intensity,
+        "language": language_mode,
+        "tone": output_tone
+    }
+    
     # AI Detection simulation
     st.markdown("### 🎯 AI Detection Meter")
     detection_score = st.slider(
@@ -470,24 +491,57 @@ with st.sidebar:
     st.markdown("### 📊 Session Statistics")
     col1, col2 = st.columns(2)
     with col1:
-        st.metric("Processed", len(st.session_state.history))
+        st.metric("Processed", st.session_state.history.total)
     with col2:
-        avg_detection = sum([item.get('detection', 8) for item in st.session_state.history]) / max(len(st.session_state.history), 1)
-        st.metric("Avg Detection", f"{avg_detection:.1f}%")
+        st.metric("Avg Detection", f"{st.session_state.history.average_detection:.1f}%")
+    cache_stats = get_result_cache().stats()
+    st.caption(f"⚡ Cache: {cache_stats['hits']} hits / {cache_stats['misses']} misses ({cache_stats['hit_rate']:.0%})")
+    
+    # Per-stage engine timings (shared by every session on this server)
+    with st.expander("🩺 Diagnostics"):
+        stage_stats = humanizer.humanizer.stats
+        stage_stats.enabled = st.toggle("Record stage timings", value=stage_stats.enabled)
+        timings = stage_stats.snapshot()
+        if timings:
+            st.dataframe(
+                [
+                    {
+                        "Stage": stage,
+                        "Calls": row["calls"],
+                        "Total (ms)": round(row["seconds"] * 1000, 1),
+                        "Mean (ms)": round(row["mean_ms"], 2),
+                        "kchars/s": round(row["chars_per_s"] / 1000, 1),
+                    }
+                    for stage, row in timings.items()
+                ],
+                hide_index=True,
+                use_container_width=True
+            )
+        else:
+            st.caption("No timings recorded yet")
+        if st.button("♻️ Reset Timings", use_container_width=True):
+            stage_stats.reset()
+            st.rerun()
     
     # Processing history
     st.markdown("### 📚 Recent History")
     if st.session_state.history:
-        for i, item in enumerate(st.session_state.history[-3:]):
-            with st.expander(f"Entry {len(st.session_state.history)-2+i} - {item['timestamp'][:16]}"):
-                st.text_area("Input", item['input'][:100] + "...", height=60, disabled=True, key=f"hist_in_{i}")
-                st.text_area("Output", item['output'][:100] + "...", height=60, disabled=True, key=f"hist_out_{i}")
-                st.caption(f"Mode: {item.get('mode', 'Advanced')} | Detection: {item.get('detection', 8)}%")
+        for item in st.session_state.history.recent(3):
+            with st.expander(f"Entry {item.number} - {item.timestamp[:16]}"):
+                st.text_area("Input", item.input_text or item.input_preview, height=60, disabled=True, key=f"hist_in_{item.number}")
+                st.text_area("Output", item.output_text or item.output_preview, height=60, disabled=True, key=f"hist_out_{item.number}")
+                st.caption(f"Mode: {item.mode} | Detection: {item.detection}% | {item.input_words} → {item.output_words} words")
     else:
         st.info("No history yet")
     
+    st.session_state.history.keep_full_text = st.checkbox(
+        "Keep full texts in history",
+        value=st.session_state.history.keep_full_text,
+        help="Store complete inputs and outputs instead of short previews (uses more memory)"
+    )
+    
     if st.button("🗑️ Clear History", use_container_width=True):
-        st.session_state.history = []
+        st.session_state.history.clear()
         st.rerun()
     
     # Export/Import settings
@@ -585,14 +639,7 @@ with col3:
 
 with col4:
     if st.button("🎲 Random", use_container_width=True):
-        examples = [
-            "The implementation of advanced machine learning algorithms has demonstrated significant improvements in operational efficiency and cost reduction metrics across multiple organizational departments.",
-            "Furthermore, the utilization of sophisticated computational methodologies facilitates enhanced data processing capabilities and enables more comprehensive analytical frameworks.",
-            "The optimization process requires careful consideration of multiple parameters to ensure maximum performance while maintaining system stability and resource efficiency.",
-            "Subsequently, the comprehensive analysis indicates that substantial improvements can be attributed to the strategic implementation of innovative technological solutions.",
-            "The deployment of artificial intelligence systems necessitates thorough evaluation of computational requirements and scalability considerations for optimal performance."
-        ]
-        st.session_state.input_value = random.choice(examples)
+        st.session_state.input_value = random.choice(SAMPLE_SENTENCES)
         st.rerun()
 
 # Handle button clicks
@@ -605,31 +652,46 @@ if clear_button:
     st.rerun()
 
 if example_button:
-    st.session_state.input_value = "The implementation of this advanced methodology will facilitate significant optimization and subsequently demonstrate substantial improvements in performance metrics through sophisticated algorithmic processing."
+    st.session_state.input_value = DEFAULT_EXAMPLE
     st.rerun()
 
+# Real-time mode: re-humanize only the paragraphs that changed
+if real_time_enabled and input_text.strip() and not process_button:
+    live = st.session_state.live_humanizer
+    live_key = (input_text, st.session_state.variant, tuple(sorted(engine_settings.items())))
+    if live_key != st.session_state.live_key:
+        # Recompute only when the committed input, variant or settings changed
+        st.session_state.result = live.humanize(input_text, seed=st.session_state.variant, settings=engine_settings)
+        st.session_state.original_text = input_text
+        st.session_state.live_key = live_key
+    st.caption(f"🔴 Live: {live.last_processed} paragraphs updated, {live.last_reused} reused")
+
 # Processing Section
 if process_button:
     if input_text:
-        # Show enhanced processing animation
-        processing_messages = [
-            "🧠 Analyzing text patterns...",
-            "⚡ Applying transformation algorithms...",
-            "🎯 Optimizing human-like elements...",
-            "✨ Finalizing humanization..."
-        ]
+        # Progress driven by the real pipeline stages
+        processing_messages = {
+            "tokenize": "🧠 Analyzing text patterns...",
+            "lexicon": "⚡ Replacing formal vocabulary...",
+            "sentences": "⚡ Rewriting sentences...",
+            "contractions": "🎯 Applying contractions...",
+            "casual": "🎯 Adding casual expressions...",
+            "structure": "✨ Varying sentence structure...",
+            "imperfections": "✨ Finalizing humanization...",
+            "paragraphs": "⚡ Humanizing paragraphs...",
+            "cache": "✨ Loaded from cache",
+        }
         
         progress_bar = st.progress(0)
         status_text = st.empty()
         
-        for i, message in enumerate(processing_messages):
-            status_text.text(message)
-            progress_bar.progress((i + 1) / len(processing_messages))
-            time.sleep(0.3)
+        def report_progress(stage, fraction):
+            status_text.text(processing_messages.get(stage, stage))
+            progress_bar.progress(min(fraction, 1.0))
         
         # Process the text with advanced settings
         try:
-            result = st.session_state.humanizer.humanize(input_text)
+            result = humanizer.humanize(input_text, seed=st.session_state.variant, settings=engine_settings, progress=report_progress)
         except Exception as e:
             st.error(f"Error processing text: {e}")
             st.error("Please try refreshing the page or contact support.")
@@ -639,17 +701,16 @@ if process_button:
         
         # Add to history with metadata
         simulated_detection = random.randint(3, 12)
-        history_item = {
-            'timestamp': datetime.now().isoformat(),
-            'input': input_text,
-            'output': result,
-            'detection': simulated_detection,
-            'mode': transformation_mode,
-            'intensity': intensity,
-            'language_mode': language_mode,
-            'tone': output_tone
-        }
-        st.session_state.history.append(history_item)
+        st.session_state.history.add(
+            timestamp=datetime.now().isoformat(),
+            input_text=input_text,
+            output_text=result,
+            detection=simulated_detection,
+            mode=transformation_mode,
+            intensity=intensity,
+            language_mode=language_mode,
+            tone=output_tone
+        )
         st.session_state.ai_detection_score = simulated_detection
         
         # Clear progress indicators
@@ -660,8 +721,79 @@ if process_button:
     else:
         st.error("⚠️ Please enter some text to humanize!")
 
-# Results Section
-if st.session_state.result:
+# Download payloads, built only when a download is requested
+def build_download_text():
+    """Original and humanized text with processing details"""
+    return f"""Original Text:
+{st.session_state.original_text}
+
+Humanized Text:
+{st.session_state.result}
+
+Processing Details:
+- Mode: {st.session_state.transformation_mode}
+- Detection Score: {st.session_state.ai_detection_score}%
+- Processed: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+"""
+
+def build_report(change_ratio, intensity):
+    """JSON-ready report of the last humanization"""
+    return {
+        "timestamp": datetime.now().isoformat(),
+        "original_text": st.session_state.original_text,
+        "humanized_text": st.session_state.result,
+        "statistics": {
+            "original_words": len(st.session_state.original_text.split()),
+            "humanized_words": len(st.session_state.result.split()),
+            "change_percentage": change_ratio,
+            "ai_detection_score": st.session_state.ai_detection_score
+        },
+        "settings": {
+            "mode": st.session_state.transformation_mode,
+            "intensity": intensity
+        }
+    }
+
+# Extra tools under the results; their buttons rerun only this fragment
+@st.fragment
+def advanced_options(engine_settings, intensity, change_ratio):
+    # Additional advanced options
+    st.markdown("### 🛠️ Advanced Options")
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        if st.button("📊 Export Report", use_container_width=True):
+            st.download_button(
+                "Download JSON Report",
+                data=json.dumps(build_report(change_ratio, intensity), indent=2),
+                file_name=f"humanization_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+                mime="application/json"
+            )
+    
+    with col2:
+        if st.button("🔍 Analyze Text", use_container_width=True):
+            # Text analysis
+            analysis = {
+                "Readability": "High" if len(st.session_state.result.split()) < 50 else "Medium",
+                "Complexity": "Low" if st.session_state.ai_detection_score < 10 else "Medium",
+                "Human-likeness": "High" if st.session_state.ai_detection_score < 15 else "Medium"
+            }
+            
+            for metric, value in analysis.items():
+                st.metric(metric, value)
+    
+    with col3:
+        if st.button("⚡ Quick Test", use_container_width=True):
+            # Quick test with sample text
+            test_text = "The implementation of this methodology demonstrates significant optimization."
+            test_result = humanizer.humanize(test_text, seed=0, settings=engine_settings)
+            
+            st.text_area("Test Input", test_text, height=60, disabled=True)
+            st.text_area("Test Output", test_result, height=60, disabled=True)
+
+# Results Section: buttons rerun only this panel, not the CSS, sidebar or input
+@st.fragment
+def results_panel(engine_settings, intensity):
     st.markdown("""
     <div class="results-section">
         <h3 class="section-title">📊 Results</h3>
@@ -671,8 +803,6 @@ if st.session_state.result:
     # Statistics
     original_words = len(st.session_state.original_text.split())
     result_words = len(st.session_state.result.split())
-    original_chars = len(st.session_state.original_text)
-    result_chars = len(st.session_state.result)
     change_ratio = (result_words / original_words * 100) if original_words > 0 else 0
     
     st.markdown(f"""
@@ -706,84 +836,24 @@ if st.session_state.result:
         
         with col1:
             # AI Detection Comparison Chart
-            fig = go.Figure()
-            
-            fig.add_trace(go.Indicator(
-                mode = "gauge+number",
-                value = 95,
-                domain = {'x': [0, 1], 'y': [0, 1]},
-                title = {'text': "Before Humanization", 'font': {'size': 16}},
-                gauge = {
-                    'axis': {'range': [None, 100]},
-                    'bar': {'color': "#ff4444"},
-                    'steps': [
-                        {'range': [0, 20], 'color': "#4CAF50"},
-                        {'range': [20, 50], 'color': "#FFC107"},
-                        {'range': [50, 100], 'color': "#F44336"}],
-                    'threshold': {
-                        'line': {'color': "red", 'width': 4},
-                        'thickness': 0.75,
-                        'value': 90}}))
-            
-            fig.update_layout(
-                height=300,
-                paper_bgcolor="rgba(0,0,0,0)",
-                plot_bgcolor="rgba(0,0,0,0)",
-                font={'color': "#333", 'family': "Inter"}
-            )
-            
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(detection_gauge(95, "Before Humanization", "#ff4444", "red", 90), use_container_width=True)
         
         with col2:
             # After Humanization Chart
-            fig2 = go.Figure()
-            
-            fig2.add_trace(go.Indicator(
-                mode = "gauge+number",
-                value = st.session_state.ai_detection_score,
-                domain = {'x': [0, 1], 'y': [0, 1]},
-                title = {'text': "After Humanization", 'font': {'size': 16}},
-                gauge = {
-                    'axis': {'range': [None, 100]},
-                    'bar': {'color': "#4CAF50"},
-                    'steps': [
-                        {'range': [0, 20], 'color': "#4CAF50"},
-                        {'range': [20, 50], 'color': "#FFC107"},
-                        {'range': [50, 100], 'color': "#F44336"}],
-                    'threshold': {
-                        'line': {'color': "green", 'width': 4},
-                        'thickness': 0.75,
-                        'value': 10}}))
-            
-            fig2.update_layout(
-                height=300,
-                paper_bgcolor="rgba(0,0,0,0)",
-                plot_bgcolor="rgba(0,0,0,0)",
-                font={'color': "#333", 'family': "Inter"}
+            st.plotly_chart(
+                detection_gauge(st.session_state.ai_detection_score, "After Humanization", "#4CAF50", "green", 10),
+                use_container_width=True
             )
-            
-            st.plotly_chart(fig2, use_container_width=True)
         
         # Processing History Chart
         if len(st.session_state.history) > 1:
             st.markdown("### 📈 Detection Score Trend")
             
-            history_data = st.session_state.history[-10:]  # Last 10 entries
-            x_vals = [f"Entry {i+1}" for i in range(len(history_data))]
-            y_vals = [item.get('detection', 8) for item in history_data]
-            
-            fig3 = px.line(x=x_vals, y=y_vals, 
-                          title="AI Detection Score Over Time",
-                          labels={'x': 'Processing Session', 'y': 'Detection Score (%)'})
-            fig3.update_traces(line_color='#667eea', line_width=3)
-            fig3.update_layout(
-                height=300,
-                paper_bgcolor="rgba(0,0,0,0)",
-                plot_bgcolor="rgba(0,0,0,0)",
-                font={'color': "#333", 'family': "Inter"}
-            )
+            history_data = st.session_state.history.recent(10)  # Last 10 entries
+            x_vals = tuple(f"Entry {item.number}" for item in history_data)
+            y_vals = tuple(item.detection for item in history_data)
             
-            st.plotly_chart(fig3, use_container_width=True)
+            st.plotly_chart(detection_trend(x_vals, y_vals), use_container_width=True)
     
     # Text Comparison
     col1, col2 = st.columns(2)
@@ -825,41 +895,32 @@ if st.session_state.result:
             st.caption("Process text first to enable copying")
     
     with col2:
-        # Enhanced download with metadata
-        download_data = f"""Original Text:
-{st.session_state.original_text}
-
-Humanized Text:
-{st.session_state.result}
-
-Processing Details:
-- Mode: {st.session_state.transformation_mode}
-- Detection Score: {st.session_state.ai_detection_score}%
-- Processed: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-"""
-        st.download_button(
-            label="💾 Download",
-            data=download_data,
-            file_name=f"humanized_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt",
-            mime="text/plain",
-            use_container_width=True
-        )
+        # Enhanced download with metadata, built only when asked for
+        if st.button("💾 Download", use_container_width=True):
+            st.download_button(
+                label="⬇️ Save TXT",
+                data=build_download_text(),
+                file_name=f"humanized_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt",
+                mime="text/plain",
+                use_container_width=True
+            )
     
     with col3:
         if st.button("🔄 Re-process", use_container_width=True):
-            # Re-process with same settings
-            result = st.session_state.humanizer.humanize(st.session_state.original_text)
+            # Re-process with same settings, asking for a new variant
+            st.session_state.variant += 1
+            result = humanizer.humanize(st.session_state.original_text, seed=st.session_state.variant, settings=engine_settings)
             st.session_state.result = result
-            st.rerun()
+            st.rerun(scope="fragment")
     
     with col4:
         if st.button("🧬 Enhance", use_container_width=True):
-            # Apply double processing for extra humanization
-            temp_result = st.session_state.result
-            for _ in range(2):
-                temp_result = st.session_state.humanizer.humanize(temp_result)
-            st.session_state.result = temp_result
-            st.rerun()
+            # Two more passes over one tokenized document; stops early if nothing changes
+            st.session_state.result = humanizer.humanize(
+                st.session_state.result, seed=st.session_state.variant,
+                settings=dict(engine_settings, passes=2)
+            )
+            st.rerun(scope="fragment")
     
     with col5:
         if st.button("🆕 New Text", use_container_width=True):
@@ -868,54 +929,10 @@ Processing Details:
                 del st.session_state.result
             st.rerun()
     
-    # Additional advanced options
-    st.markdown("### 🛠️ Advanced Options")
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        if st.button("📊 Export Report", use_container_width=True):
-            report = {
-                "timestamp": datetime.now().isoformat(),
-                "original_text": st.session_state.original_text,
-                "humanized_text": st.session_state.result,
-                "statistics": {
-                    "original_words": len(st.session_state.original_text.split()),
-                    "humanized_words": len(st.session_state.result.split()),
-                    "change_percentage": change_ratio,
-                    "ai_detection_score": st.session_state.ai_detection_score
-                },
-                "settings": {
-                    "mode": st.session_state.transformation_mode,
-                    "intensity": intensity if 'intensity' in locals() else 7
-                }
-            }
-            st.download_button(
-                "Download JSON Report",
-                data=json.dumps(report, indent=2),
-                file_name=f"humanization_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
-                mime="application/json"
-            )
-    
-    with col2:
-        if st.button("🔍 Analyze Text", use_container_width=True):
-            # Text analysis
-            analysis = {
-                "Readability": "High" if len(st.session_state.result.split()) < 50 else "Medium",
-                "Complexity": "Low" if st.session_state.ai_detection_score < 10 else "Medium",
-                "Human-likeness": "High" if st.session_state.ai_detection_score < 15 else "Medium"
-            }
-            
-            for metric, value in analysis.items():
-                st.metric(metric, value)
-    
-    with col3:
-        if st.button("⚡ Quick Test", use_container_width=True):
-            # Quick test with sample text
-            test_text = "The implementation of this methodology demonstrates significant optimization."
-            test_result = st.session_state.humanizer.humanize(test_text)
-            
-            st.text_area("Test Input", test_text, height=60, disabled=True)
-            st.text_area("Test Output", test_result, height=60, disabled=True)
+    advanced_options(engine_settings, intensity, change_ratio)
+
+if st.session_state.result:
+    results_panel(engine_settings, intensity)
 
 # Example Templates Section
 st.markdown("---")
@@ -925,23 +942,7 @@ st.markdown("""
 </div>
 """, unsafe_allow_html=True)
 
-examples = [
-    {
-        "title": "📚 Academic Paper",
-        "text": "The implementation of advanced machine learning algorithms has demonstrated significant improvements in operational efficiency and cost reduction metrics across multiple organizational departments.",
-        "icon": "🎓"
-    },
-    {
-        "title": "⚙️ Technical Documentation", 
-        "text": "Furthermore, the utilization of sophisticated computational methodologies facilitates enhanced data processing capabilities and enables more comprehensive analytical frameworks.",
-        "icon": "💻"
-    },
-    {
-        "title": "💼 Business Report",
-        "text": "The optimization process requires careful consideration of multiple parameters to ensure maximum performance while maintaining system stability and resource efficiency.",
-        "icon": "📊"
-    }
-]
+examples = EXAMPLE_TEMPLATES
 
 st.markdown('<div class="example-grid">', unsafe_allow_html=True)
 